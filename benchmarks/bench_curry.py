@@ -0,0 +1,80 @@
+import sys
+import os
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.curry import curry_explicit, uncurry_explicit
+
+NUMBER = 2_000
+
+
+def closure_curry(function, arity):
+    """Previous implementation: every application re-splats the collected arguments"""
+
+    def curry(*args):
+        if len(args) == arity:
+            return function(*args)
+        if len(args) > arity:
+            raise TypeError("More arguments than expected")
+        return lambda elem: curry(*args, elem)
+
+    return curry
+
+
+def apply_all(curry, arity: int) -> None:
+    """Apply curried function to arguments one by one"""
+    for i in range(arity):
+        curry = curry(i)
+
+
+def compiled_curry(function, arity):
+    """Curry with generated code"""
+    return curry_explicit(function, arity, compiled=True)
+
+
+def timed(make, arity: int) -> float:
+    """Best time of full application in microseconds"""
+    curry = make(lambda *args: None, arity)
+    best = min(timeit.repeat(lambda: apply_all(curry, arity), number=NUMBER, repeat=3))
+    return best / NUMBER * 1e6
+
+
+def closure_uncurry(function, arity):
+    """Previous implementation: arguments are applied one by one"""
+
+    def uncurry(*args):
+        func = function
+        for elem in args:
+            func = func(elem)
+        return func
+
+    return uncurry
+
+
+def timed_round_trip(curry, uncurry, arity: int) -> float:
+    """Best time of a call of uncurried curried function in microseconds"""
+    func = uncurry(curry(lambda *args: None, arity), arity)
+    args = tuple(range(arity))
+    best = min(timeit.repeat(lambda: func(*args), number=NUMBER, repeat=3))
+    return best / NUMBER * 1e6
+
+
+def main():
+    print(f"{'arity':>6} {'closure, us':>12} {'linked, us':>11} {'compiled, us':>13}")
+    for arity in (2, 4, 8, 16, 32, 64):
+        closure = timed(closure_curry, arity)
+        linked = timed(curry_explicit, arity)
+        compiled = timed(compiled_curry, arity)
+        print(f"{arity:>6} {closure:>12.2f} {linked:>11.2f} {compiled:>13.2f}")
+
+    print()
+    print(f"{'arity':>6} {'stepwise uncurry, us':>21} {'direct uncurry, us':>19}")
+    for arity in (2, 4, 8, 16, 32, 64):
+        stepwise = timed_round_trip(closure_curry, closure_uncurry, arity)
+        direct = timed_round_trip(curry_explicit, uncurry_explicit, arity)
+        print(f"{arity:>6} {stepwise:>21.2f} {direct:>19.2f}")
+
+
+if __name__ == "__main__":
+    main()
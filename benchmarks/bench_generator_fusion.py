@@ -0,0 +1,55 @@
+import sys
+import os
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.generator import generate, pipeline, results, Map, Filter
+
+NUM_ITEMS = 200_000
+
+
+def inc(v: int) -> int:
+    """Map function"""
+    return v + 1
+
+
+def odd(v: int) -> bool:
+    """Filter predicate"""
+    return v % 2 == 1
+
+
+def generator_stage(func):
+    """Opaque generator operation"""
+
+    def operation(stream):
+        for v in stream:
+            yield func(v)
+
+    return operation
+
+
+def timed(*operations) -> float:
+    """Best time of collecting pipeline over generated range"""
+    return min(
+        timeit.repeat(
+            lambda: results(pipeline(generate(1, NUM_ITEMS), *operations), sum),
+            number=1,
+            repeat=3,
+        )
+    )
+
+
+def main():
+    print(f"items: {NUM_ITEMS}")
+    print(f"{'depth':>6} {'generators, s':>14} {'unfused, s':>11} {'fused, s':>9}")
+    for depth in (1, 2, 4, 8, 16, 32):
+        maps = [Map(inc) for _ in range(depth)]
+        generators = timed(*(generator_stage(inc) for _ in range(depth)), Filter(odd))
+        unfused = timed(*(op.__call__ for op in maps), Filter(odd).__call__)
+        fused = timed(*maps, Filter(odd))
+        print(f"{depth:>6} {generators:>14.3f} {unfused:>11.3f} {fused:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.generator import generate, pipeline, results, Map, Filter
+from project.generator_numeric import arange, vmap, vfilter, ChunkSum, np
+
+NUM_ITEMS = int(sys.argv[1]) if len(sys.argv) > 1 else 10**8
+
+
+def square(v):
+    """Elementwise map function"""
+    return v * v
+
+
+def odd(v):
+    """Elementwise predicate"""
+    return v % 2 == 1
+
+
+def per_element() -> int:
+    """Sum of squares of odd numbers over single numbers"""
+    return results(pipeline(generate(1, NUM_ITEMS), Filter(odd), Map(square)), sum)
+
+
+def chunked(backend: str):
+    """Sum of squares of odd numbers over numeric chunks"""
+
+    def run() -> int:
+        chunks = arange(1, NUM_ITEMS, backend=backend)
+        return results(pipeline(chunks, vfilter(odd), vmap(square)), ChunkSum())
+
+    return run
+
+
+def main():
+    variants = [("per element", per_element), ("array chunks", chunked("array"))]
+    if np is not None:
+        variants.append(("numpy chunks", chunked("numpy")))
+    print(f"items: {NUM_ITEMS}")
+    print(f"{'variant':>13} {'time, s':>9} {'Mitems/s':>9}")
+    expected = None
+    for name, run in variants:
+        start = time.perf_counter()
+        res = run()
+        elapsed = time.perf_counter() - start
+        assert expected is None or res == expected
+        expected = res
+        print(f"{name:>13} {elapsed:>9.2f} {NUM_ITEMS / elapsed / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.generator import generate, pipeline, results, parallel_map
+
+NUM_ITEMS = 2_000
+CHUNKSIZE = 50
+
+
+def heavy(n: int) -> int:
+    """CPU-bound function"""
+    acc = 0
+    for i in range(2_000):
+        acc = (acc + i * n) % 1_000_003
+    return acc
+
+
+def timed(*operations) -> float:
+    """Time of collecting pipeline over generated range"""
+    start = time.perf_counter()
+    results(pipeline(generate(1, NUM_ITEMS), *operations), sum)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"cpus: {os.cpu_count()}, items: {NUM_ITEMS}, chunksize: {CHUNKSIZE}")
+    base = timed(lambda stream: map(heavy, stream))
+    print(f"{'sequential':>22}: {base:.3f} s")
+    for ordered in (True, False):
+        for workers in (1, 2, 4, 8):
+            t = timed(parallel_map(heavy, workers, CHUNKSIZE, ordered))
+            name = f"{'ordered' if ordered else 'unordered'}, {workers} workers"
+            print(f"{name:>22}: {t:.3f} s, speedup {base / t:.2f}")
+
+
+if __name__ == "__main__":
+    main()
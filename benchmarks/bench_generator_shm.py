@@ -0,0 +1,39 @@
+import sys
+import os
+import time
+from array import array
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.generator import pipeline, results, parallel_map
+from project.generator_collectors import Count
+from project.generator_shm import shm_map
+
+NUM_CHUNKS = 200
+CHUNK_LEN = 1 << 17
+
+
+def same(chunk):
+    """Worker function which returns its chunk, only transport is measured"""
+    return chunk
+
+
+def timed(operation) -> float:
+    """Time of passing float chunks through operation"""
+    chunk = array("d", range(CHUNK_LEN))
+    start = time.perf_counter()
+    results(pipeline((chunk for _ in range(NUM_CHUNKS)), operation), Count())
+    return time.perf_counter() - start
+
+
+def main():
+    mb = NUM_CHUNKS * CHUNK_LEN * 8 / 2**20
+    print(f"chunks: {NUM_CHUNKS} x {CHUNK_LEN} doubles, {mb:.0f} MB")
+    pickled = timed(parallel_map(same, workers=1, executor="process"))
+    shared = timed(shm_map(same, capacity=1 << 24))
+    print(f"{'pickled':>8}: {pickled:.3f} s, {mb / pickled:.0f} MB/s")
+    print(f"{'shm':>8}: {shared:.3f} s, {mb / shared:.0f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import sys
+import os
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.hashtable import HashTable
+
+NUM_KEYS = 100_000
+NUM_LOOKUPS = 100_000
+
+
+def make_table(bloom: bool) -> HashTable:
+    """Fill hash table with string keys"""
+    t = HashTable(bloom=bloom)
+    for i in range(NUM_KEYS):
+        t[f"key{i}"] = i
+    return t
+
+
+def make_lookups(hit_ratio: float) -> list:
+    """Keys to look up, the first hit_ratio part of them exist"""
+    hits = int(NUM_LOOKUPS * hit_ratio)
+    return [f"key{i}" for i in range(hits)] + [
+        f"miss{i}" for i in range(NUM_LOOKUPS - hits)
+    ]
+
+
+def main():
+    tables = {"plain": make_table(False), "bloom": make_table(True)}
+    print(f"keys: {NUM_KEYS}, lookups: {NUM_LOOKUPS}")
+    print(f"{'hit ratio':>10} {'plain, s':>10} {'bloom, s':>10}")
+    for percent in range(0, 101, 25):
+        keys = make_lookups(percent / 100)
+        times = [
+            min(timeit.repeat(lambda: [k in t for k in keys], number=1, repeat=3))
+            for t in tables.values()
+        ]
+        print(f"{percent:>9}% {times[0]:>10.4f} {times[1]:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import sys
+import os
+import io
+import pickle
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import project.hashtable as hashtable
+from project.hashtable import HashTable
+
+NUM_KEYS = 500_000
+
+
+def timed(func) -> float:
+    """Run function several times and return the best elapsed time"""
+    return min(timeit.repeat(func, number=1, repeat=3))
+
+
+def generic_dumps(t: HashTable) -> bytes:
+    """Pickle hash table through generic object state"""
+    return pickle.dumps(t.__dict__, pickle.HIGHEST_PROTOCOL)
+
+
+def generic_loads(data: bytes) -> HashTable:
+    """Unpickle hash table from generic object state"""
+    t = HashTable.__new__(HashTable)
+    t.__dict__.update(pickle.loads(data))
+    return t
+
+
+def dumps(t: HashTable) -> bytes:
+    """Write hash table with dump"""
+    buffer = io.BytesIO()
+    t.dump(buffer)
+    return buffer.getvalue()
+
+
+def loads(data: bytes) -> HashTable:
+    """Read hash table with load"""
+    return HashTable.load(io.BytesIO(data))
+
+
+def rehash_loads(data: bytes) -> HashTable:
+    """Read hash table with load as if it was written with another hash seed"""
+    fingerprint = hashtable._fingerprint
+    hashtable._fingerprint = lambda: 0
+    try:
+        return loads(data)
+    finally:
+        hashtable._fingerprint = fingerprint
+
+
+def report(name: str, t: HashTable, write, read) -> None:
+    """Print size and throughput of one format"""
+    data = write(t)
+    write_time = timed(lambda: write(t))
+    read_time = timed(lambda: read(data))
+    print(
+        f"{name:>20} {len(data) / 2**20:>8.2f} "
+        f"{NUM_KEYS / write_time:>12.0f} {NUM_KEYS / read_time:>12.0f}"
+    )
+
+
+def main():
+    print(f"keys: {NUM_KEYS}")
+    print(f"{'format':>20} {'MB':>8} {'write keys/s':>12} {'read keys/s':>12}")
+    for bloom in (False, True):
+        t = HashTable(bloom=bloom)
+        for i in range(NUM_KEYS):
+            t[f"key{i}"] = i
+        suffix = " + bloom" if bloom else ""
+        report("generic" + suffix, t, generic_dumps, generic_loads)
+        report("dump/load" + suffix, t, dumps, loads)
+        report("rehash load" + suffix, t, dumps, rehash_loads)
+
+
+if __name__ == "__main__":
+    main()
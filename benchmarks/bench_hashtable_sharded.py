@@ -0,0 +1,44 @@
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.hashtable import HashTable
+from project.hashtable_sharded import ShardedHashTable
+
+NUM_KEYS = 200_000
+BATCH = 10_000
+
+
+def bench_local() -> float:
+    """Throughput of one HashTable in the current process"""
+    t = HashTable()
+    start = time.perf_counter()
+    for i in range(NUM_KEYS):
+        t[i] = i
+    for i in range(NUM_KEYS):
+        t[i]
+    return 2 * NUM_KEYS / (time.perf_counter() - start)
+
+
+def bench_sharded(num_shards: int) -> float:
+    """Throughput of batched set_many/get_many"""
+    with ShardedHashTable(num_shards=num_shards) as t:
+        start = time.perf_counter()
+        for i in range(0, NUM_KEYS, BATCH):
+            t.set_many((k, k) for k in range(i, i + BATCH))
+        for i in range(0, NUM_KEYS, BATCH):
+            t.get_many(range(i, i + BATCH))
+        return 2 * NUM_KEYS / (time.perf_counter() - start)
+
+
+def main():
+    print(f"cpus: {os.cpu_count()}, keys: {NUM_KEYS}, batch: {BATCH}")
+    print(f"{'local':>10}: {bench_local():>12.0f} ops/s")
+    for num_shards in (1, 2, 4, 8):
+        print(f"{num_shards:>10}: {bench_sharded(num_shards):>12.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
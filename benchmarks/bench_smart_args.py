@@ -0,0 +1,88 @@
+import sys
+import os
+import timeit
+import inspect
+from copy import deepcopy
+from functools import wraps
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.smart_args import smart_args, Evaluated, Isolated
+from project.smart_args_metrics import SmartArgsMetrics
+
+NUMBER = 20_000
+
+
+def walking_smart_args(func):
+    """Previous implementation: every call walks all parameters"""
+    s = inspect.signature(func)
+
+    @wraps(func)
+    def wrapped(*args, **kwargs):
+        if args:
+            raise TypeError("Error: smart args need named arguments")
+        kwargs_new = {}
+        for name, par in s.parameters.items():
+            if name in kwargs:
+                value = kwargs[name]
+                if isinstance(par.default, Isolated):
+                    value = deepcopy(value)
+                assert not isinstance(value, Evaluated)
+                assert not isinstance(value, Isolated)
+            else:
+                default = par.default
+                if isinstance(default, Evaluated):
+                    value = default.func()
+                elif isinstance(default, Isolated):
+                    raise TypeError(f"Error: argument {name} must be Isolated")
+                elif default is par.empty:
+                    raise TypeError(f"Error: argument {name} is not provided")
+                else:
+                    value = default
+            kwargs_new[name] = value
+        return func(**kwargs_new)
+
+    return wrapped
+
+
+def make_function(num_params: int, special: bool):
+    """Function of keyword-only parameters, the first one is Isolated and the second Evaluated"""
+    params = [f"p{i}=0" for i in range(num_params)]
+    if special:
+        params[0] = "p0=Isolated()"
+        if num_params > 1:
+            params[1] = "p1=Evaluated(lambda: 1)"
+    namespace = {"Isolated": Isolated, "Evaluated": Evaluated}
+    exec(f"def func(*, {', '.join(params)}):\n    return p0", namespace)
+    return namespace["func"]
+
+
+def timed(decorator, num_params: int, special: bool) -> float:
+    """Best time of a call with all plain arguments passed in microseconds"""
+    func = decorator(make_function(num_params, special))
+    kwargs = {f"p{i}": i for i in range(num_params) if not (special and i == 1)}
+    best = min(timeit.repeat(lambda: func(**kwargs), number=NUMBER, repeat=3))
+    return best / NUMBER * 1e6
+
+
+def main():
+    for special in (False, True):
+        print("Isolated and Evaluated parameters" if special else "plain parameters")
+        print(f"{'params':>7} {'walking, us':>12} {'plan, us':>9}")
+        for num_params in (1, 2, 5, 10, 20, 30):
+            walking = timed(walking_smart_args, num_params, special)
+            plan = timed(smart_args, num_params, special)
+            print(f"{num_params:>7} {walking:>12.2f} {plan:>9.2f}")
+        print()
+
+    print("metrics")
+    print(f"{'params':>7} {'off, us':>8} {'on, us':>7}")
+    for num_params in (1, 10, 30):
+        off = timed(smart_args, num_params, True)
+        with SmartArgsMetrics():
+            on = timed(smart_args, num_params, True)
+        print(f"{num_params:>7} {off:>8.2f} {on:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
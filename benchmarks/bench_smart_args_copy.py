@@ -0,0 +1,64 @@
+import sys
+import os
+import timeit
+from copy import deepcopy
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.smart_args_copy import fast_copy
+
+NUMBER = 20
+
+
+def records(num: int) -> list:
+    """List of flat records"""
+    return [
+        {"id": i, "name": f"user{i}", "active": i % 2 == 0, "score": i * 0.5}
+        for i in range(num)
+    ]
+
+
+def response(num: int) -> dict:
+    """Nested JSON response"""
+    return {
+        "status": "ok",
+        "items": [
+            {"id": i, "tags": ["a", "b"], "owner": {"id": i % 10, "roles": ["r"]}}
+            for i in range(num)
+        ],
+        "page": {"number": 1, "size": num},
+    }
+
+
+def config() -> dict:
+    """Small nested config"""
+    return {
+        "db": {"host": "localhost", "port": 5432, "options": {"timeout": 3.0}},
+        "features": ["x", "y", "z"],
+        "limits": (10, 20, 30),
+    }
+
+
+def timed(copy, value) -> float:
+    """Best time of a copy in microseconds"""
+    best = min(timeit.repeat(lambda: copy(value), number=NUMBER, repeat=3))
+    return best / NUMBER * 1e6
+
+
+def main():
+    payloads = [
+        ("config", config()),
+        ("records 1000", records(1000)),
+        ("response 1000", response(1000)),
+        ("records 10000", records(10000)),
+    ]
+    print(f"{'payload':>14} {'deepcopy, us':>13} {'fast_copy, us':>14}")
+    for name, value in payloads:
+        assert fast_copy(value) == deepcopy(value)
+        print(
+            f"{name:>14} {timed(deepcopy, value):>13.1f} {timed(fast_copy, value):>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
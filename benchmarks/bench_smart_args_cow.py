@@ -0,0 +1,70 @@
+import sys
+import os
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from project.smart_args import smart_args, Isolated
+
+NUMBER = 10
+
+
+def payload(num_records: int) -> dict:
+    """Nested read-mostly argument"""
+    return {
+        "records": [
+            {"id": i, "name": f"user{i}", "tags": ["a", "b", "c"], "scores": [i, i + 1]}
+            for i in range(num_records)
+        ],
+        "meta": {"version": 1, "owner": "admin"},
+    }
+
+
+@smart_args
+def read_deepcopy(*, data=Isolated()):
+    """Reads a few fields of a deep copy"""
+    return data["meta"]["version"] + data["records"][0]["scores"][1]
+
+
+@smart_args
+def read_cow(*, data=Isolated(copy_on_write=True)):
+    """Reads a few fields of a proxy"""
+    return data["meta"]["version"] + data["records"][0]["scores"][1]
+
+
+@smart_args
+def write_deepcopy(*, data=Isolated()):
+    """Writes one nested field of a deep copy"""
+    data["records"][0]["tags"].append("d")
+    return len(data["records"])
+
+
+@smart_args
+def write_cow(*, data=Isolated(copy_on_write=True)):
+    """Writes one nested field of a proxy"""
+    data["records"][0]["tags"].append("d")
+    return len(data["records"])
+
+
+def timed(func, data) -> float:
+    """Best time of a call in milliseconds"""
+    best = min(timeit.repeat(lambda: func(data=data), number=NUMBER, repeat=3))
+    return best / NUMBER * 1e3
+
+
+def main():
+    print(
+        f"{'records':>8} {'read deepcopy, ms':>18} {'read cow, ms':>13}"
+        f" {'write deepcopy, ms':>19} {'write cow, ms':>14}"
+    )
+    for num_records in (100, 1_000, 10_000):
+        data = payload(num_records)
+        print(
+            f"{num_records:>8} {timed(read_deepcopy, data):>18.3f}"
+            f" {timed(read_cow, data):>13.3f} {timed(write_deepcopy, data):>19.3f}"
+            f" {timed(write_cow, data):>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
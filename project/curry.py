@@ -1,48 +1,401 @@
-from typing import Any, Callable
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from functools import lru_cache
 
 
-def curry_explicit(function: Callable[..., Any], arity: int) -> Callable[..., Any]:
+def _unwind(node: Optional[Tuple[Any, Any]], count: int) -> List[Any]:
+    """
+    Collect arguments from the linked list of applied arguments.
+
+    Args:
+        node: The last applied argument and the rest of the list.
+        count: Number of arguments in the list.
+
+    Returns:
+        Arguments in order of application.
+    """
+    args: List[Any] = [None] * count
+    i = count - 1
+    while node is not None:
+        args[i], node = node
+        i -= 1
+    return args
+
+
+class Partial:
+    """
+    Curried function with some arguments applied, it accepts exactly one argument.
+
+    Attributes:
+        function: The given function.
+        arity: Number of arguments of curried function.
+        args: The last applied argument and the rest of the list.
+        count: Number of applied arguments.
+    """
+
+    __slots__ = ("function", "arity", "args", "count")
+
+    function: Callable[..., Any]
+    arity: int
+    args: Tuple[Any, Any]
+    count: int
+
+    @classmethod
+    def make(
+        cls, function: Callable[..., Any], arity: int, args: Tuple[Any, Any], count: int
+    ) -> "Partial":
+        partial = cls.__new__(cls)
+        partial.function = function
+        partial.arity = arity
+        partial.args = args
+        partial.count = count
+        return partial
+
+    def __call__(self, elem: Any) -> Any:
+        count = self.count + 1
+        node = (elem, self.args)
+        if count == self.arity:
+            return self.function(*_unwind(node, count))
+        return Partial.make(self.function, self.arity, node, count)
+
+
+class Curried:
+    """
+    Curried function which accumulates applied arguments.
+
+    Arguments are kept in a linked list shared with previous partial applications, so every
+    application takes constant time and the arguments are assembled once for the final call.
+    The first call accepts several arguments, partial applications accept exactly one.
+
+    Attributes:
+        function: The given function.
+        arity: Number of arguments of curried function.
+    """
+
+    __slots__ = ("function", "arity")
+
+    def __init__(self, function: Callable[..., Any], arity: int) -> None:
+        self.function = function
+        self.arity = arity
+
+    def __call__(self, *args: Any) -> Any:
+        if len(args) == self.arity:
+            return self.function(*args)
+        if len(args) > self.arity:
+            raise TypeError("More arguments than expected")
+        if not args:
+            return self
+
+        node: Any = None
+        for elem in args:
+            node = (elem, node)
+        return Partial.make(self.function, self.arity, node, len(args))
+
+
+class Uncurried:
+    """
+    Function which accepts all arguments at once and calls the original function directly.
+
+    Attributes:
+        function: The original function.
+        arity: Number of arguments.
+    """
+
+    __slots__ = ("function", "arity")
+
+    def __init__(self, function: Callable[..., Any], arity: int) -> None:
+        self.function = function
+        self.arity = arity
+
+    def __call__(self, *args: Any) -> Any:
+        if len(args) != self.arity:
+            raise TypeError(
+                f"Error: expected {self.arity} arguments, but got {len(args)} arguments"
+            )
+        return self.function(*args)
+
+
+def _curried(function: Callable[..., Any]) -> Optional[Curried]:
+    """
+    Find the Curried object behind a function made by curry_explicit.
+
+    Args:
+        function: Any function.
+
+    Returns:
+        Curried object or None if the function is not a result of curry_explicit.
+    """
+    if isinstance(function, Curried):
+        return function
+    curried = getattr(function, "curried", None)
+    return curried if isinstance(curried, Curried) else None
+
+
+class CacheStats:
+    """
+    Statistics of caches of a memoized curried function.
+
+    Attributes:
+        hits: Number of results found in the cache.
+        misses: Number of results computed by the function.
+        partial_hits: Number of partial applications found in the prefix trie.
+        partial_misses: Number of partial applications added to the prefix trie.
+        evictions: Number of results and partial applications removed from caches.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.partial_hits = 0
+        self.partial_misses = 0
+        self.evictions = 0
+
+
+class PrefixNode:
+    """
+    Partial application of a memoized curried function, a node of the prefix trie.
+
+    Attributes:
+        memo: Memoized curried function.
+        parent: Partial application without the last argument, None for the root.
+        arg: The last applied argument.
+        args: All applied arguments.
+        children: Partial applications with one more argument by the argument.
+    """
+
+    __slots__ = ("memo", "parent", "arg", "args", "children")
+
+    def __init__(
+        self,
+        memo: "Memoized",
+        parent: Optional["PrefixNode"],
+        arg: Any,
+        args: Tuple[Any, ...],
+    ) -> None:
+        self.memo = memo
+        self.parent = parent
+        self.arg = arg
+        self.args = args
+        self.children: Dict[Any, "PrefixNode"] = {}
+
+    def __call__(self, elem: Any) -> Any:
+        return self.memo.apply(self, elem)
+
+
+class Memoized:
+    """
+    Curried pure function with caches of results and of partial applications.
+
+    Results are cached by the tuple of all arguments. Partial applications with the same
+    leading arguments are the same objects, they are kept in a trie keyed by argument.
+    Both caches are bounded and evict the least recently used entries, evicting
+    a partial application removes the partial applications which extend it.
+    Arguments must be hashable.
+
+    Args:
+        function: The given pure function.
+        arity: Number of arguments of curried function.
+        cache_size: Maximum number of results and of partial applications.
+
+    Attributes:
+        stats: Hits, misses and evictions.
+    """
+
+    def __init__(
+        self, function: Callable[..., Any], arity: int, cache_size: int = 1024
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError("Cache size must be positive")
+        self.function = function
+        self.arity = arity
+        self.cache_size = cache_size
+        self.stats = CacheStats()
+        self.results: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+        self.partials: "OrderedDict[PrefixNode, None]" = OrderedDict()
+        self.root = PrefixNode(self, None, None, ())
+
+    def __call__(self, *args: Any) -> Any:
+        if len(args) > self.arity:
+            raise TypeError("More arguments than expected")
+        if not self.arity:
+            return self.result(())
+
+        result: Any = self
+        node = self.root
+        for elem in args:
+            result = node = self.apply(node, elem)
+        return result
+
+    def apply(self, node: PrefixNode, elem: Any) -> Any:
+        """
+        Apply the next argument to a partial application.
+
+        Args:
+            node: Partial application.
+            elem: The next argument.
+
+        Returns:
+            Result of the function if all arguments are applied, otherwise partial application.
+        """
+        if len(node.args) + 1 == self.arity:
+            return self.result(node.args + (elem,))
+
+        child = node.children.get(elem)
+        if child is not None and child in self.partials:
+            self.stats.partial_hits += 1
+            self.partials.move_to_end(child)
+            return child
+
+        self.stats.partial_misses += 1
+        child = node.children[elem] = PrefixNode(self, node, elem, node.args + (elem,))
+        self.partials[child] = None
+        if len(self.partials) > self.cache_size:
+            self._evict(next(iter(self.partials)))
+        return child
+
+    def result(self, args: Tuple[Any, ...]) -> Any:
+        """
+        Get the result of the function from the cache or compute it.
+
+        Args:
+            args: All arguments.
+
+        Returns:
+            Result of the function.
+        """
+        try:
+            value = self.results[args]
+        except KeyError:
+            self.stats.misses += 1
+            value = self.results[args] = self.function(*args)
+            if len(self.results) > self.cache_size:
+                self.results.popitem(last=False)
+                self.stats.evictions += 1
+            return value
+        self.stats.hits += 1
+        self.results.move_to_end(args)
+        return value
+
+    def _evict(self, node: PrefixNode) -> None:
+        if node.parent is not None:
+            node.parent.children.pop(node.arg, None)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node in self.partials:
+                del self.partials[node]
+                self.stats.evictions += 1
+            stack.extend(node.children.values())
+            node.children = {}
+
+    def cache_clear(self) -> None:
+        """Remove all cached results and partial applications, statistics are kept."""
+        self.results.clear()
+        for node in list(self.partials):
+            node.children = {}
+        self.partials.clear()
+        self.root.children = {}
+
+
+MAX_COMPILED_ARITY = 64
+
+
+@lru_cache(maxsize=None)
+def _compiled_factory(arity: int) -> Callable[..., Callable[..., Any]]:
+    """
+    Generate nested functions with fixed parameters for the given arity.
+
+    Args:
+        arity: Number of arguments of curried function, positive.
+
+    Returns:
+        Factory which takes the function and the fallback for the first call with
+        several arguments and returns the curried function. The fallback is kept
+        in the curried attribute of the result.
+    """
+    params = [f"a{i}" for i in range(arity)]
+    lines = [
+        "def factory(function, fallback):",
+        "    def c0(a0, *rest):",
+        "        if rest:",
+        "            return fallback(a0, *rest)",
+    ]
+    indent = " " * 8
+    for i in range(1, arity):
+        lines.append(f"{indent}def c{i}(a{i}):")
+        indent += "    "
+    lines.append(f"{indent}return function({', '.join(params)})")
+    for i in range(arity - 1, 0, -1):
+        indent = indent[:-4]
+        lines.append(f"{indent}return c{i}")
+    lines.append("    c0.curried = fallback")
+    lines.append("    return c0")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["factory"]
+
+
+def curry_explicit(
+    function: Callable[..., Any],
+    arity: int,
+    compiled: bool = False,
+    memoize: bool = False,
+    cache_size: int = 1024,
+) -> Callable[..., Any]:
     """
     Convert a function with several arguments into a curried function.
 
+    In compiled mode the curried function is a chain of generated nested functions with
+    fixed parameters, the code is generated once per arity. Partial applications of it
+    are plain functions of one argument. Code for arities above MAX_COMPILED_ARITY would be
+    nested too deeply for Python, such functions are curried with Curried.
+
+    In memoized mode results of a pure function and partial applications with common
+    leading arguments are cached, see Memoized.
+
+    Currying a result of curry_explicit or uncurry_explicit with the same arity
+    curries the original function, so round trips don't add intermediate calls.
+
     Args:
         function: The given function.
         arity: Number of arguments of curried function.
+        compiled: Whether to use generated code specialized for the arity.
+        memoize: Whether to cache results and partial applications.
+        cache_size: Maximum number of cached results and of partial applications.
 
     Returns:
         A curried function.
 
     Raises:
         ValueError: Arity can't be negative
+        ValueError: Compiled and memoized modes can't be combined
         TypeError: More arguments than expected
     """
     if arity < 0:
         raise ValueError("Arity can't be negative")
 
-    if arity == 0:
-
-        def zero() -> Any:
-            return function()
-
-        return zero
-
-    def curry(*args: Any) -> Any:
+    origin = function if isinstance(function, Uncurried) else _curried(function)
+    if origin is not None and origin.arity == arity:
+        function = origin.function
 
-        if len(args) == arity:
-            return function(*args)
-
-        if len(args) > arity:
-            raise TypeError("More arguments than expected")
+    if memoize:
+        if compiled:
+            raise ValueError("Compiled and memoized modes can't be combined")
+        return Memoized(function, arity, cache_size)
 
-        return lambda elem: curry(*args, elem)
-
-    return curry
+    curried = Curried(function, arity)
+    if compiled and 0 < arity <= MAX_COMPILED_ARITY:
+        return _compiled_factory(arity)(function, curried)
+    return curried
 
 
 def uncurry_explicit(function: Callable[..., Any], arity: int) -> Callable[..., Any]:
     """
     Convert a curried function back into a function.
 
+    A result of curry_explicit with the same arity is not applied argument by argument,
+    the original function is called directly.
+
     Args:
         function: The curried function.
         arity: Number of arguments, which expected by the curried function.
@@ -57,6 +410,10 @@ def uncurry_explicit(function: Callable[..., Any], arity: int) -> Callable[...,
     if arity < 0:
         raise ValueError("Arity can't be negative")
 
+    curried = _curried(function)
+    if curried is not None and curried.arity == arity:
+        return Uncurried(curried.function, arity)
+
     if arity == 0:
 
         def zero() -> Any:
@@ -1,36 +1,365 @@
-from typing import Any, Generator, Iterable, Callable, Iterator
-from functools import reduce
+from typing import (
+    Any,
+    Generator,
+    Iterable,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Dict,
+    Tuple,
+)
+from functools import reduce, lru_cache
+from itertools import chain, compress, islice
+from array import array
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
+import os
+import queue
+import threading
+import time
 
 
-def generate(start: int, end: int) -> Generator[Any, None, None]:
+def generate(
+    start: int, end: int, chunksize: Optional[int] = None
+) -> Generator[Any, None, None]:
     """
     The function 'generate' creates a lazy sequence of numbers from start to end inclusive.
 
     Args:
         start: int: First integer value of the sequence.
         end: int: Last integer value of the sequence (inclusive).
+        chunksize: Optional[int]: If given, yield ranges of chunksize numbers instead of single numbers.
 
     Yield:
         int: Next integer value in the range from start to end.
+        range: Next chunk of the range from start to end, if chunksize is given.
+
+    Raises:
+        ValueError: Chunksize is not positive.
 
     Mypy:
         SendType: None - Not used.
         ReturnType: None - Not used.
     """
 
-    for val in range(start, end + 1):
-        yield val
+    if chunksize is None:
+        yield from range(start, end + 1)
+        return
+    if chunksize < 1:
+        raise ValueError("Chunksize must be positive")
+    for val in range(start, end + 1, chunksize):
+        yield range(val, min(val + chunksize, end + 1))
+
+
+class Map:
+    """
+    Declarative pipeline operation which applies func to every element.
+
+    Args:
+        func (Callable[[Any], Any]): Function to apply.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self.func = func
+
+    def __call__(self, stream: Iterator[Any]) -> Iterator[Any]:
+        return map(self.func, stream)
+
+
+class Filter:
+    """
+    Declarative pipeline operation which keeps elements satisfying predicate.
+
+    Args:
+        func (Callable[[Any], Any]): Predicate.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self.func = func
+
+    def __call__(self, stream: Iterator[Any]) -> Iterator[Any]:
+        return filter(self.func, stream)
+
+
+class FlatMap:
+    """
+    Declarative pipeline operation which replaces every element with elements of func result.
+
+    Args:
+        func (Callable[[Any], Iterable[Any]]): Function that returns an iterable.
+    """
+
+    def __init__(self, func: Callable[[Any], Iterable[Any]]) -> None:
+        self.func = func
+
+    def __call__(self, stream: Iterator[Any]) -> Iterator[Any]:
+        return chain.from_iterable(map(self.func, stream))
+
+
+DECLARATIVE = (Map, Filter, FlatMap)
+
+
+@lru_cache(maxsize=None)
+def _fused_factory(
+    kinds: Tuple[str, ...]
+) -> Callable[..., Callable[[Iterator[Any]], Iterator[Any]]]:
+    """
+    The function generates a single loop which applies declarative operations of given kinds.
+
+    Args:
+        kinds: Tuple[str, ...]: Class names of operations in order.
+
+    Returns:
+        Callable[..., Callable[[Iterator[Any]], Iterator[Any]]]: Factory which takes functions of
+            operations and returns the fused operation.
+    """
+
+    params = ", ".join(f"f{i}" for i in range(len(kinds)))
+    lines = [
+        f"def factory({params}):",
+        "    def fused(stream):",
+        "        for x in stream:",
+    ]
+    indent = " " * 12
+    for i, kind in enumerate(kinds):
+        if kind == "Map":
+            lines.append(f"{indent}x = f{i}(x)")
+        elif kind == "Filter":
+            lines.append(f"{indent}if not f{i}(x):")
+            lines.append(f"{indent}    continue")
+        else:
+            lines.append(f"{indent}for x in f{i}(x):")
+            indent += "    "
+    lines.append(f"{indent}yield x")
+    lines.append("    return fused")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["factory"]
+
+
+def fuse(
+    operations: Iterable[Callable[[Iterator[Any]], Iterator[Any]]]
+) -> List[Callable[[Iterator[Any]], Iterator[Any]]]:
+    """
+    The function replaces every run of consecutive declarative operations with one fused operation.
+
+    Args:
+        operations: Iterable[Callable[[Iterator[Any]], Iterator[Any]]]: Operations of pipeline.
+
+    Returns:
+        List[Callable[[Iterator[Any]], Iterator[Any]]]: Operations where runs of Map, Filter
+            and FlatMap are fused, other operations are kept as they are.
+    """
+
+    fused: List[Callable[[Iterator[Any]], Iterator[Any]]] = []
+    run: List[Any] = []
+
+    def flush() -> None:
+        if len(run) == 1:
+            fused.append(run[0])
+        elif run:
+            kinds = tuple(type(op).__name__ for op in run)
+            op = _fused_factory(kinds)(*(op.func for op in run))
+            op.__name__ = "+".join(kinds)
+            fused.append(op)
+        run.clear()
+
+    for op in operations:
+        if type(op) in DECLARATIVE:
+            run.append(op)
+        else:
+            flush()
+            fused.append(op)
+    flush()
+    return fused
+
+
+class StageStats:
+    """
+    Statistics of one pipeline stage collected by PipelineProfile.
+
+    Times are attributed to the stage itself: time spent in upstream stages is subtracted.
+    If upstream runs on another thread (threaded stage), nothing is subtracted and the times
+    are the time the consumer spent waiting for the stage.
+
+    Attributes:
+        name (str): Name of operation ("source" for the data values).
+        own_thread (bool): Upstream of the stage runs on another thread.
+        items_out (int): Number of produced elements.
+        peak_buffered (int): Maximum number of input elements read to produce one output element.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        upstream: Optional["StageStats"] = None,
+        own_thread: bool = False,
+    ) -> None:
+        self.name = name
+        self.upstream = upstream
+        self.own_thread = own_thread
+        self.items_out = 0
+        self.peak_buffered = 0
+        self.total_wall_time = 0.0
+        self.total_cpu_time = 0.0
+
+    @property
+    def items_in(self) -> int:
+        """Number of elements read from upstream."""
+        return self.upstream.items_out if self.upstream is not None else 0
+
+    @property
+    def wall_time(self) -> float:
+        """Wall time spent in the stage."""
+        if self.upstream is None or self.own_thread:
+            return self.total_wall_time
+        return self.total_wall_time - self.upstream.total_wall_time
+
+    @property
+    def cpu_time(self) -> float:
+        """CPU time of the consumer thread spent in the stage."""
+        if self.upstream is None or self.own_thread:
+            return self.total_cpu_time
+        return self.total_cpu_time - self.upstream.total_cpu_time
+
+
+class PipelineProfile:
+    """
+    Summary of a profiled pipeline run, pass it to pipeline(..., profile=...).
+
+    A threaded stage and its upstream run on another thread: the stage is timed as the time the
+    consumer waits for it, and its upstream stages are timed on the stage thread.
+    Workers of parallel_map are not timed, the stage is timed as the time waiting for their results.
+
+    Args:
+        callback (Optional[Callable[["PipelineProfile"], Any]]): Called when the stream is exhausted or closed.
+
+    Attributes:
+        stages (List[StageStats]): Statistics of the source and every stage.
+    """
+
+    def __init__(
+        self, callback: Optional[Callable[["PipelineProfile"], Any]] = None
+    ) -> None:
+        self.callback = callback
+        self.stages: List[StageStats] = []
+
+    def summary(self) -> str:
+        """
+        Format statistics as a table.
+
+        Returns:
+            str: Table with a row for every stage.
+        """
+
+        rows = [
+            f"{'stage':<24} {'in':>10} {'out':>10} {'wall, s':>10} {'cpu, s':>10} {'buffered':>9}"
+        ]
+        for st in self.stages:
+            rows.append(
+                f"{st.name[:24]:<24} {st.items_in:>10} {st.items_out:>10} "
+                f"{st.wall_time:>10.4f} {st.cpu_time:>10.4f} {st.peak_buffered:>9}"
+            )
+        return "\n".join(rows)
+
+    def _watch(
+        self, stream: Iterator[Any], name: str, last: bool, own_thread: bool = False
+    ) -> Iterator[Any]:
+        """
+        Add statistics for a stage and wrap its output.
+
+        Args:
+            stream: Iterator[Any]: Output of the stage.
+            name: str: Name of the stage.
+            last: bool: The stage is the last one, the callback is called when it finishes.
+            own_thread: bool: Upstream of the stage runs on another thread.
+
+        Returns:
+            Iterator[Any]: Elements of stream.
+        """
+
+        stats = StageStats(name, self.stages[-1] if self.stages else None, own_thread)
+        self.stages.append(stats)
+        return self._timed(stream, stats, last)
+
+    def _timed(
+        self, stream: Iterator[Any], stats: StageStats, last: bool
+    ) -> Generator[Any, None, None]:
+        """
+        Time every step of stream and count its elements.
+
+        Args:
+            stream: Iterator[Any]: Output of a stage.
+            stats: StageStats: Statistics of the stage.
+            last: bool: The stage is the last one, the callback is called when it finishes.
+
+        Yield:
+            Any: Elements of stream.
+        """
+
+        upstream = stats.upstream
+        perf_counter = time.perf_counter
+        thread_time = time.thread_time
+        read = 0
+        try:
+            while True:
+                wall = perf_counter()
+                cpu = thread_time()
+                try:
+                    elem = next(stream)
+                except StopIteration:
+                    return
+                finally:
+                    stats.total_wall_time += perf_counter() - wall
+                    stats.total_cpu_time += thread_time() - cpu
+                stats.items_out += 1
+                if upstream is not None:
+                    stats.peak_buffered = max(
+                        stats.peak_buffered, upstream.items_out - read
+                    )
+                    read = upstream.items_out
+                yield elem
+        finally:
+            if last and self.callback is not None:
+                self.callback(self)
+
+
+def _name(operation: Callable[[Iterator[Any]], Iterator[Any]]) -> str:
+    """
+    The function returns a name of pipeline operation for profiling.
+
+    Args:
+        operation: Callable[[Iterator[Any]], Iterator[Any]]: Operation of pipeline.
+
+    Returns:
+        str: Name of the function or type of the operation object.
+    """
+
+    return getattr(operation, "__name__", type(operation).__name__)
 
 
 def pipeline(
-    val: Iterable[Any], *operations: Callable[[Iterator[Any]], Iterator[Any]]
+    val: Iterable[Any],
+    *operations: Callable[[Iterator[Any]], Iterator[Any]],
+    profile: Optional[PipelineProfile] = None,
 ) -> Iterator[Any]:
     """
     The function pipeline creates a lazy data processing pipeline by applying operations to the data stream.
 
+    Consecutive declarative operations (Map, Filter, FlatMap) are fused into a single loop.
+
     Args:
         val: Iterable[Any]: The iterable data values of any type.
         *operations: Callable[[Iterator[Any]], Iterator[Any]]: Function that takes Iterator[Any] argument and returns a iterator which produces elements of any type.
+        profile: Optional[PipelineProfile]: If given, every stage is wrapped to collect its statistics into profile.
 
     Returns:
         Iterator[Any]: Generator that produces transformed data stream.
@@ -41,9 +370,20 @@ def pipeline(
     """
 
     stream = iter(val)
-    for elem in operations:
-        stream = elem(stream)
+    operations = tuple(fuse(operations))
+    if profile is None:
+        for elem in operations:
+            stream = elem(stream)
+        return stream
 
+    stream = profile._watch(stream, "source", not operations)
+    for i, elem in enumerate(operations):
+        stream = profile._watch(
+            iter(elem(stream)),
+            _name(elem),
+            i == len(operations) - 1,
+            getattr(elem, "own_thread", False),
+        )
     return stream
 
 
@@ -51,7 +391,7 @@ def results(
     stream: Generator[Any, None, None],
     collector: Callable[..., Any] = list,
     *args: Any,
-    **kwargs: Any
+    **kwargs: Any,
 ) -> Any:
     """
     The function collects a lazy data stream into a concrete collection.
@@ -71,3 +411,259 @@ def results(
     """
 
     return collector(stream, *args, **kwargs)
+
+
+def _apply_chunk(func: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    """
+    The function applies func to every element of chunk, it runs inside a worker.
+
+    Args:
+        func: Callable[[Any], Any]: Function to apply.
+        chunk: List[Any]: Elements.
+
+    Returns:
+        List[Any]: Results in order of elements.
+    """
+
+    return [func(elem) for elem in chunk]
+
+
+def parallel_map(
+    func: Callable[[Any], Any],
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    executor: str = "process",
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which applies func to elements on a pool of workers.
+
+    Elements are sent to workers in chunks of chunksize elements. At most two chunks per worker
+    are in flight at once, so the stream is still read lazily.
+
+    Args:
+        func: Callable[[Any], Any]: Function to apply, it must be picklable for process pool.
+        workers: Optional[int]: Number of workers (number of processors by default).
+        chunksize: int: Number of elements sent to a worker at once.
+        ordered: bool: Keep order of elements; otherwise chunks are yielded as soon as they are ready.
+        executor: str: "process" or "thread".
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline.
+
+    Raises:
+        ValueError: Unknown executor or not positive chunksize or workers.
+    """
+
+    if executor not in ("process", "thread"):
+        raise ValueError(f"Unknown executor {executor}")
+    if chunksize < 1:
+        raise ValueError("Chunksize must be positive")
+    num_workers = workers if workers is not None else os.cpu_count() or 1
+    if num_workers < 1:
+        raise ValueError("Number of workers must be positive")
+    max_in_flight = 2 * num_workers
+
+    def operation(stream: Iterator[Any]) -> Generator[Any, None, None]:
+        pool: Executor
+        if executor == "process":
+            pool = ProcessPoolExecutor(num_workers)
+        else:
+            pool = ThreadPoolExecutor(num_workers)
+
+        pending: deque = deque()
+
+        def submit() -> bool:
+            chunk = list(islice(stream, chunksize))
+            if not chunk:
+                return False
+            pending.append(pool.submit(_apply_chunk, func, chunk))
+            return True
+
+        try:
+            while len(pending) < max_in_flight and submit():
+                pass
+            while pending:
+                if ordered:
+                    done: List[Future] = [pending.popleft()]
+                else:
+                    done = list(wait(pending, return_when=FIRST_COMPLETED)[0])
+                    for fut in done:
+                        pending.remove(fut)
+                for fut in done:
+                    res = fut.result()
+                    submit()
+                    yield from res
+        finally:
+            for fut in pending:
+                fut.cancel()
+            pool.shutdown(wait=True)
+
+    operation.__name__ = f"parallel_map({_name(func)})"
+    return operation
+
+
+_END = object()
+
+
+def threaded(
+    operation: Callable[[Iterator[Any]], Iterator[Any]], maxsize: int = 16
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function marks a pipeline operation to run on its own thread.
+
+    The operation and everything upstream of it are iterated by a background thread which puts results
+    into a bounded queue, so it blocks when the consumer falls maxsize elements behind.
+    Exceptions of the operation are raised in the consumer, closing the stream stops the thread.
+
+    Args:
+        operation: Callable[[Iterator[Any]], Iterator[Any]]: Operation to run on a thread.
+        maxsize: int: Capacity of the queue between the thread and the consumer.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline.
+
+    Raises:
+        ValueError: Maxsize is not positive.
+    """
+
+    if maxsize < 1:
+        raise ValueError("Maxsize must be positive")
+
+    def stage(stream: Iterator[Any]) -> Generator[Any, None, None]:
+        buffer: queue.Queue = queue.Queue(maxsize)
+        stop = threading.Event()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce() -> None:
+            it: Iterator[Any] = iter(())
+            try:
+                it = iter(operation(stream))
+                for elem in it:
+                    if not put((None, elem)):
+                        break
+                else:
+                    put((None, _END))
+            except BaseException as e:
+                put((e, None))
+            finally:
+                close = getattr(it, "close", None)
+                if close is not None:
+                    close()
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                error, elem = buffer.get()
+                if error is not None:
+                    raise error
+                if elem is _END:
+                    break
+                yield elem
+        finally:
+            stop.set()
+            thread.join()
+
+    stage.__name__ = f"threaded({_name(operation)})"
+    stage.own_thread = True  # type: ignore[attr-defined]
+    return stage
+
+
+def batch(
+    n: int, typecode: Optional[str] = None
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which groups elements into chunks of n elements.
+
+    Args:
+        n: int: Number of elements in a chunk, the last chunk may be shorter.
+        typecode: Optional[str]: If given, chunks are arrays with this typecode instead of lists.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline.
+
+    Raises:
+        ValueError: N is not positive.
+    """
+
+    if n < 1:
+        raise ValueError("Batch size must be positive")
+
+    def operation(stream: Iterator[Any]) -> Generator[Any, None, None]:
+        while True:
+            chunk: Any = list(islice(stream, n))
+            if not chunk:
+                return
+            if typecode is not None:
+                chunk = array(typecode, chunk)
+            yield chunk
+
+    operation.__name__ = f"batch({n})"
+    return operation
+
+
+def unbatch() -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which flattens a stream of chunks into elements.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline.
+    """
+
+    return chain.from_iterable
+
+
+def batch_map(
+    func: Callable[[Any], Iterable[Any]]
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which applies func to whole chunks.
+
+    Args:
+        func: Callable[[Any], Iterable[Any]]: Function that takes a chunk and returns a chunk of results.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline over a stream of chunks.
+    """
+
+    return lambda stream: map(func, stream)
+
+
+def batch_filter(
+    predicate: Callable[[Any], Iterable[Any]]
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which filters elements of chunks with a mask.
+
+    Args:
+        predicate: Callable[[Any], Iterable[Any]]: Function that takes a chunk and returns a truth value for every element.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline over a stream of chunks.
+            Array chunks stay arrays with the same typecode, other chunks become lists.
+            Chunks which support indexing with a mask array of the same shape (NumPy arrays)
+            are indexed with the mask.
+    """
+
+    def operation(stream: Iterator[Any]) -> Generator[Any, None, None]:
+        for chunk in stream:
+            mask = predicate(chunk)
+            if hasattr(mask, "shape") and getattr(chunk, "shape", None) == mask.shape:
+                yield chunk[mask]
+                continue
+            kept = compress(chunk, mask)
+            if isinstance(chunk, array):
+                yield array(chunk.typecode, kept)
+            else:
+                yield list(kept)
+
+    return operation
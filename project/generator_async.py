@@ -0,0 +1,184 @@
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Union,
+)
+from collections import deque
+import asyncio
+
+from project.generator_collectors import Collector
+
+
+async def agenerate(start: int, end: int) -> AsyncGenerator[Any, None]:
+    """
+    The function 'agenerate' creates a lazy async sequence of numbers from start to end inclusive.
+
+    Args:
+        start: int: First integer value of the sequence.
+        end: int: Last integer value of the sequence (inclusive).
+
+    Yield:
+        int: Next integer value in the range from start to end.
+
+    Mypy:
+        SendType: None - Not used.
+    """
+
+    for val in range(start, end + 1):
+        yield val
+
+
+async def to_async(val: Iterable[Any]) -> AsyncGenerator[Any, None]:
+    """
+    The function adapts a synchronous iterable (for example generate or pipeline) to an async stream.
+
+    Args:
+        val: Iterable[Any]: The iterable data values of any type.
+
+    Yield:
+        Any: Next value of the iterable.
+
+    Mypy:
+        SendType: None - Not used.
+    """
+
+    for elem in val:
+        yield elem
+
+
+def to_sync(stream: AsyncIterable[Any]) -> Generator[Any, None, None]:
+    """
+    The function adapts an async stream to a synchronous generator.
+
+    Every element is awaited on a private event loop, so it must not be called from a running loop.
+
+    Args:
+        stream: AsyncIterable[Any]: Async data stream.
+
+    Yield:
+        Any: Next value of the stream.
+
+    Mypy:
+        SendType: None - Not used.
+        ReturnType: None - Not used.
+    """
+
+    loop = asyncio.new_event_loop()
+    it = stream.__aiter__()
+    try:
+        while True:
+            try:
+                elem = loop.run_until_complete(it.__anext__())
+            except StopAsyncIteration:
+                break
+            yield elem
+    finally:
+        aclose = getattr(it, "aclose", None)
+        if aclose is not None:
+            loop.run_until_complete(aclose())
+        loop.close()
+
+
+def async_pipeline(
+    val: Union[Iterable[Any], AsyncIterable[Any]],
+    *operations: Callable[[AsyncIterator[Any]], AsyncIterator[Any]]
+) -> AsyncIterator[Any]:
+    """
+    The function async_pipeline creates a lazy async data processing pipeline by applying operations to the data stream.
+
+    Args:
+        val: Union[Iterable[Any], AsyncIterable[Any]]: The data values, synchronous iterables are adapted with to_async.
+        *operations: Callable[[AsyncIterator[Any]], AsyncIterator[Any]]: Function that takes AsyncIterator[Any] argument and returns an async iterator.
+
+    Returns:
+        AsyncIterator[Any]: Async stream that produces transformed data.
+    """
+
+    if isinstance(val, AsyncIterable):
+        stream = val.__aiter__()
+    else:
+        stream = to_async(val)
+    for elem in operations:
+        stream = elem(stream)
+
+    return stream
+
+
+def amap(
+    func: Callable[[Any], Awaitable[Any]], concurrency: int = 1
+) -> Callable[[AsyncIterator[Any]], AsyncIterator[Any]]:
+    """
+    The function creates an async pipeline operation which awaits func for every element.
+
+    Up to concurrency calls run at the same time, results keep the order of elements.
+
+    Args:
+        func: Callable[[Any], Awaitable[Any]]: Async function to apply.
+        concurrency: int: Maximum number of running calls.
+
+    Returns:
+        Callable[[AsyncIterator[Any]], AsyncIterator[Any]]: Operation for async_pipeline.
+
+    Raises:
+        ValueError: Concurrency is not positive.
+    """
+
+    if concurrency < 1:
+        raise ValueError("Concurrency must be positive")
+
+    async def operation(stream: AsyncIterator[Any]) -> AsyncGenerator[Any, None]:
+        pending: deque = deque()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    try:
+                        elem = await stream.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.append(asyncio.ensure_future(func(elem)))
+                if not pending:
+                    break
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    return operation
+
+
+async def async_results(
+    stream: AsyncIterable[Any],
+    collector: Callable[..., Any] = list,
+    *args: Any,
+    **kwargs: Any
+) -> Any:
+    """
+    The function collects an async data stream into a concrete collection.
+
+    A Collector gets elements one by one as they arrive, so the stream is not kept in memory.
+    Other callables get a list of all elements.
+
+    Args:
+        stream (AsyncIterable[Any]): Async data stream where we collect from results.
+        collector: Callable[..., Any]: Callable collects different arguments and transform it to concrete form (list by default).
+        *args: Additional positional args.
+        **kwargs: Additional keyword args.
+
+    Returns:
+        The collected result.
+    """
+
+    if isinstance(collector, Collector):
+        add = collector.add
+        async for elem in stream:
+            add(elem)
+        return collector.result()
+    return collector([elem async for elem in stream], *args, **kwargs)
@@ -0,0 +1,149 @@
+from typing import Any, Callable, Dict, Generator, Iterator, Union
+import os
+import pickle
+
+from project.generator import pipeline
+
+
+class RangeSource:
+    """
+    Checkpointable source of numbers from start to end inclusive, like generate.
+
+    Attributes:
+        position (int): Next number to yield.
+        end (int): Last number of the range (inclusive).
+    """
+
+    def __init__(self, start: int, end: int) -> None:
+        self.position = start
+        self.end = end
+
+    def __iter__(self) -> Generator[int, None, None]:
+        while self.position <= self.end:
+            value = self.position
+            self.position += 1
+            yield value
+
+    def state(self) -> Any:
+        """Get position in the range."""
+        return self.position
+
+    def restore(self, state: Any) -> None:
+        """Continue from saved position."""
+        self.position = state
+
+
+class Scan:
+    """
+    Checkpointable pipeline operation which yields running results of func, like itertools.accumulate.
+
+    Args:
+        func (Callable[[Any, Any], Any]): Function of accumulated value and element.
+        initial (Any): Initial accumulated value.
+    """
+
+    def __init__(self, func: Callable[[Any, Any], Any], initial: Any) -> None:
+        self.func = func
+        self.value = initial
+
+    def __call__(self, stream: Iterator[Any]) -> Generator[Any, None, None]:
+        for elem in stream:
+            self.value = self.func(self.value, elem)
+            yield self.value
+
+    def state(self) -> Any:
+        """Get accumulated value."""
+        return self.value
+
+    def restore(self, state: Any) -> None:
+        """Continue from saved accumulated value."""
+        self.value = state
+
+
+def _save(path: Union[str, os.PathLike], snapshot: Dict[str, Any]) -> None:
+    """
+    The function atomically replaces the snapshot file.
+
+    Args:
+        path: Union[str, os.PathLike]: Path to the snapshot.
+        snapshot: Dict[str, Any]: States of source and stages.
+    """
+
+    tmp = f"{os.fspath(path)}.tmp"
+    with open(tmp, "wb") as file:
+        pickle.dump(snapshot, file, pickle.HIGHEST_PROTOCOL)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
+
+
+def checkpointed(
+    source: Any,
+    *operations: Callable[[Iterator[Any]], Iterator[Any]],
+    path: Union[str, os.PathLike],
+    interval: int = 1000,
+) -> Generator[Any, None, None]:
+    """
+    The function creates a pipeline which saves its position to a file and resumes from it.
+
+    An element is committed when the consumer asks for the next one. After every interval committed
+    elements the states of source and of operations which have state and restore methods are saved.
+    If the file exists, the pipeline starts from the saved states, so committed elements are not
+    produced again; elements after the last snapshot are produced again.
+
+    Stateless operations must be lazy and yield at most one element per input element (map, filter),
+    other operations must expose their state.
+
+    Args:
+        source: Any: Iterable with state and restore methods, for example RangeSource.
+        *operations: Callable[[Iterator[Any]], Iterator[Any]]: Operations of pipeline.
+        path: Union[str, os.PathLike]: Path to the snapshot file.
+        interval: int: Number of committed elements between snapshots.
+
+    Yield:
+        Any: Elements of the pipeline after the last snapshot.
+
+    Raises:
+        ValueError: Interval is not positive.
+
+    Mypy:
+        SendType: None - Not used.
+        ReturnType: None - Not used.
+    """
+
+    if interval < 1:
+        raise ValueError("Interval must be positive")
+    stateful: Dict[int, Any] = {
+        i: op
+        for i, op in enumerate(operations)
+        if hasattr(op, "state") and hasattr(op, "restore")
+    }
+
+    committed = 0
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            snapshot = pickle.load(file)
+        source.restore(snapshot["source"])
+        for i, op in stateful.items():
+            op.restore(snapshot["stages"][i])
+        committed = snapshot["committed"]
+
+    def save() -> None:
+        _save(
+            path,
+            {
+                "source": source.state(),
+                "stages": {i: op.state() for i, op in stateful.items()},
+                "committed": committed,
+            },
+        )
+
+    since = 0
+    for elem in pipeline(source, *operations):
+        yield elem
+        committed += 1
+        since += 1
+        if since == interval:
+            save()
+            since = 0
+    save()
@@ -0,0 +1,369 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from bisect import bisect_right
+from abc import ABC, abstractmethod
+import heapq
+import math
+
+
+class Collector(ABC):
+    """
+    Base class of streaming collectors for results().
+
+    A collector keeps a fixed-size state, elements are added one by one. Calling a collector
+    on a stream adds all elements of the stream and returns the result, so a collector
+    can be passed to results() instead of list.
+    """
+
+    @abstractmethod
+    def add(self, elem: Any) -> None:
+        """
+        Add one element to the state.
+
+        Args:
+            elem (Any): Element of the stream.
+        """
+
+    @abstractmethod
+    def result(self) -> Any:
+        """
+        Get the result for elements added so far.
+
+        Returns:
+            Any: Result.
+        """
+
+    def __call__(self, stream: Iterable[Any]) -> Any:
+        add = self.add
+        for elem in stream:
+            add(elem)
+        return self.result()
+
+
+class RemovableCollector(Collector):
+    """Collector which can remove the oldest added element, sliding windows need it."""
+
+    @abstractmethod
+    def remove(self, elem: Any) -> None:
+        """
+        Remove the oldest added element.
+
+        Args:
+            elem (Any): The oldest element.
+        """
+
+
+class Count(RemovableCollector):
+    """Number of elements."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add(self, elem: Any) -> None:
+        self.count += 1
+
+    def remove(self, elem: Any) -> None:
+        self.count -= 1
+
+    def result(self) -> int:
+        return self.count
+
+
+class Sum(RemovableCollector):
+    """Sum of elements."""
+
+    def __init__(self) -> None:
+        self.total: Any = 0
+
+    def add(self, elem: Any) -> None:
+        self.total += elem
+
+    def remove(self, elem: Any) -> None:
+        self.total -= elem
+
+    def result(self) -> Any:
+        return self.total
+
+
+class Min(Collector):
+    """Minimum of elements, None for an empty stream."""
+
+    def __init__(self) -> None:
+        self.value: Any = None
+
+    def add(self, elem: Any) -> None:
+        if self.value is None or elem < self.value:
+            self.value = elem
+
+    def result(self) -> Any:
+        return self.value
+
+
+class Max(Collector):
+    """Maximum of elements, None for an empty stream."""
+
+    def __init__(self) -> None:
+        self.value: Any = None
+
+    def add(self, elem: Any) -> None:
+        if self.value is None or elem > self.value:
+            self.value = elem
+
+    def result(self) -> Any:
+        return self.value
+
+
+class Mean(RemovableCollector):
+    """
+    Mean of numbers with Welford's algorithm, None for an empty stream.
+
+    Attributes:
+        count (int): Number of elements.
+        mean (float): Mean of elements.
+        m2 (float): Sum of squared deviations from the mean.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, elem: Any) -> None:
+        self.count += 1
+        delta = elem - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (elem - self.mean)
+
+    def remove(self, elem: Any) -> None:
+        self.count -= 1
+        if not self.count:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = elem - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (elem - self.mean)
+
+    def result(self) -> Optional[float]:
+        return self.mean if self.count else None
+
+
+class Variance(Mean):
+    """
+    Variance of numbers with Welford's algorithm.
+
+    Args:
+        ddof (int): Delta degrees of freedom, 0 for population variance and 1 for sample variance.
+    """
+
+    def __init__(self, ddof: int = 0) -> None:
+        super().__init__()
+        self.ddof = ddof
+
+    def result(self) -> Optional[float]:
+        if self.count <= self.ddof:
+            return None
+        return self.m2 / (self.count - self.ddof)
+
+
+class TopK(Collector):
+    """
+    The k largest elements in descending order, kept in a heap of k elements.
+
+    Args:
+        k (int): Number of elements.
+        key (Optional[Callable[[Any], Any]]): Function of element to compare by.
+    """
+
+    def __init__(self, k: int, key: Optional[Callable[[Any], Any]] = None) -> None:
+        if k < 1:
+            raise ValueError("K must be positive")
+        self.k = k
+        self.key = key
+        self.heap: List[Tuple[Any, int, Any]] = []
+        self.seen = 0
+
+    def add(self, elem: Any) -> None:
+        item = (elem if self.key is None else self.key(elem), self.seen, elem)
+        self.seen += 1
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, item)
+        elif item[0] > self.heap[0][0]:
+            heapq.heapreplace(self.heap, item)
+
+    def result(self) -> List[Any]:
+        ordered = sorted(self.heap, key=lambda i: (i[0], -i[1]), reverse=True)
+        return [item[2] for item in ordered]
+
+
+def _mix(value: int) -> int:
+    """
+    Finalizer of splitmix64, it spreads bits of hash values of small numbers.
+
+    Args:
+        value (int): Hash value.
+
+    Returns:
+        int: Mixed 64-bit value.
+    """
+    value = (value + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return value ^ (value >> 31)
+
+
+class HyperLogLog(Collector):
+    """
+    Approximate number of distinct elements in 2 ** p registers.
+
+    The relative error is about 1.04 / sqrt(2 ** p).
+
+    Args:
+        p (int): Number of index bits, from 4 to 16.
+    """
+
+    def __init__(self, p: int = 12) -> None:
+        if not 4 <= p <= 16:
+            raise ValueError("P must be from 4 to 16")
+        self.p = p
+        self.registers = bytearray(1 << p)
+
+    def add(self, elem: Any) -> None:
+        x = _mix(hash(elem))
+        index = x >> (64 - self.p)
+        rest = x & ((1 << (64 - self.p)) - 1)
+        rank = 64 - self.p - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def result(self) -> int:
+        m = len(self.registers)
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+
+class Quantile(Collector):
+    """
+    Approximate quantile with the P-square algorithm, it keeps five markers.
+
+    Args:
+        q (float): Quantile from 0 to 1, 0.5 for median.
+    """
+
+    def __init__(self, q: float = 0.5) -> None:
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be from 0 to 1")
+        self.q = q
+        self.heights: List[float] = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0, 2 * q, 4 * q, 2 + 2 * q, 4]
+        self.increments = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def add(self, elem: Any) -> None:
+        h = self.heights
+        if len(h) < 5:
+            h.append(elem)
+            h.sort()
+            return
+
+        if elem < h[0]:
+            h[0] = elem
+            k = 0
+        elif elem >= h[4]:
+            h[4] = elem
+            k = 3
+        else:
+            k = bisect_right(h, elem) - 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                s = 1 if d > 0 else -1
+                height = h[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - s) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not h[i - 1] < height < h[i + 1]:
+                    height = h[i] + s * (h[i + s] - h[i]) / (n[i + s] - n[i])
+                h[i] = height
+                n[i] += s
+
+    def result(self) -> Optional[float]:
+        h = self.heights
+        if not h:
+            return None
+        if len(h) < 5:
+            return h[min(int(self.q * len(h)), len(h) - 1)]
+        return h[2]
+
+
+class Histogram(Collector):
+    """
+    Counts of elements in bins between consecutive edges, the last bin includes its right edge.
+
+    Args:
+        edges (Sequence[float]): Increasing bin edges.
+
+    Attributes:
+        counts (List[int]): Counts of bins.
+        underflow (int): Number of elements less than the first edge.
+        overflow (int): Number of elements greater than the last edge.
+    """
+
+    def __init__(self, edges: Sequence[float]) -> None:
+        if len(edges) < 2:
+            raise ValueError("Histogram needs at least two edges")
+        self.edges = list(edges)
+        self.counts = [0] * (len(self.edges) - 1)
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, elem: Any) -> None:
+        i = bisect_right(self.edges, elem) - 1
+        if i < 0:
+            self.underflow += 1
+        elif i < len(self.counts):
+            self.counts[i] += 1
+        elif elem == self.edges[-1]:
+            self.counts[-1] += 1
+        else:
+            self.overflow += 1
+
+    def result(self) -> List[int]:
+        return self.counts
+
+
+class Combine(Collector):
+    """
+    Several collectors fed in a single pass over one stream.
+
+    Args:
+        **collectors (Collector): Collectors by name.
+    """
+
+    def __init__(self, **collectors: Collector) -> None:
+        self.collectors = collectors
+        self._adds = [c.add for c in collectors.values()]
+
+    def add(self, elem: Any) -> None:
+        for add in self._adds:
+            add(elem)
+
+    def result(self) -> Dict[str, Any]:
+        return {name: c.result() for name, c in self.collectors.items()}
@@ -0,0 +1,233 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+import queue
+import threading
+
+from project.generator import pipeline, results
+
+_END = object()
+
+
+class _Branch:
+    """Bounded buffer between a node and one of its consumers."""
+
+    def __init__(self, size: int) -> None:
+        self.buffer: queue.Queue = queue.Queue(size)
+        self.closed = False
+
+
+class Node:
+    """
+    Stage of a DAG pipeline: operations applied to the output of the parent node.
+
+    Attributes:
+        parent (Optional[Node]): Node which output is the input of this node, None for the source.
+        operations (Tuple[Callable[[Iterator[Any]], Iterator[Any]], ...]): Operations of the stage.
+        children (List[Node]): Nodes which read the output of this node.
+        sinks (List[str]): Names of sinks which read the output of this node.
+    """
+
+    def __init__(
+        self,
+        parent: Optional["Node"] = None,
+        operations: Tuple[Callable[[Iterator[Any]], Iterator[Any]], ...] = (),
+    ) -> None:
+        self.parent = parent
+        self.operations = operations
+        self.children: List["Node"] = []
+        self.sinks: List[str] = []
+
+
+class Dag:
+    """
+    Pipeline with shared upstream stages and several sinks, computed in a single pass over the source.
+
+    When the output of a node is read by several consumers, every consumer gets its own bounded
+    buffer, the node waits while any of the buffers is full. Every sink runs on its own thread.
+    A sink which returns before the end of its stream stops getting elements.
+    Stages which don't lead to any sink are not run.
+
+    Args:
+        source (Iterable[Any]): The iterable data values of any type.
+        buffer (int): Capacity of the buffer of every branch.
+
+    Attributes:
+        root (Node): Node which outputs the source.
+    """
+
+    def __init__(self, source: Iterable[Any], buffer: int = 64) -> None:
+        if buffer < 1:
+            raise ValueError("Buffer must be positive")
+        self.source = source
+        self.buffer = buffer
+        self.root = Node()
+        self.nodes = [self.root]
+        self.collectors: Dict[str, Tuple[Node, Callable[..., Any], Any, Any]] = {}
+
+    def stage(
+        self, parent: Node, *operations: Callable[[Iterator[Any]], Iterator[Any]]
+    ) -> Node:
+        """
+        Add a stage which reads the output of parent.
+
+        Args:
+            parent (Node): Node which output is transformed.
+            *operations (Callable[[Iterator[Any]], Iterator[Any]]): Operations as in pipeline.
+
+        Returns:
+            Node: The new node.
+        """
+        node = Node(parent, operations)
+        parent.children.append(node)
+        self.nodes.append(node)
+        return node
+
+    def sink(
+        self,
+        name: str,
+        node: Node,
+        collector: Callable[..., Any] = list,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Add a sink which collects the output of node as results() does.
+
+        Args:
+            name (str): Name of the result.
+            node (Node): Node which output is collected.
+            collector (Callable[..., Any]): Callable collects the stream (list by default).
+            *args: Additional positional args of collector.
+            **kwargs: Additional keyword args of collector.
+
+        Raises:
+            ValueError: Sink with this name already exists.
+        """
+        if name in self.collectors:
+            raise ValueError(f"Sink {name} already exists")
+        node.sinks.append(name)
+        self.collectors[name] = (node, collector, args, kwargs)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Read the source once and compute all sinks.
+
+        Returns:
+            Dict[str, Any]: Results of sinks by name.
+
+        Raises:
+            Exception: The first exception raised by a stage or a collector.
+        """
+        stop = threading.Event()
+        errors: List[BaseException] = []
+        threads: List[threading.Thread] = []
+        inputs: Dict[Any, Iterator[Any]] = {}
+        res: Dict[str, Any] = {}
+
+        def guarded(target: Callable[..., Any], *args: Any) -> threading.Thread:
+            def body() -> None:
+                try:
+                    target(*args)
+                except BaseException as e:
+                    errors.append(e)
+                    stop.set()
+
+            thread = threading.Thread(target=body, daemon=True)
+            threads.append(thread)
+            return thread
+
+        def drain(branch: _Branch) -> Generator[Any, None, None]:
+            while True:
+                try:
+                    elem = branch.buffer.get(timeout=0.05)
+                except queue.Empty:
+                    if stop.is_set():
+                        return
+                    continue
+                if elem is _END:
+                    return
+                yield elem
+
+        def put(branch: _Branch, elem: Any) -> None:
+            while not stop.is_set() and not branch.closed:
+                try:
+                    branch.buffer.put(elem, timeout=0.05)
+                    return
+                except queue.Full:
+                    pass
+
+        def close(branch: Optional[_Branch]) -> None:
+            if branch is not None:
+                branch.closed = True
+
+        def distribute(
+            stream: Iterator[Any], branches: List[_Branch], origin: Optional[_Branch]
+        ) -> None:
+            for elem in stream:
+                if stop.is_set():
+                    return
+                if all(branch.closed for branch in branches):
+                    close(origin)
+                    return
+                for branch in branches:
+                    put(branch, elem)
+            for branch in branches:
+                put(branch, _END)
+
+        def until_stop(stream: Iterator[Any]) -> Generator[Any, None, None]:
+            for elem in stream:
+                if stop.is_set():
+                    return
+                yield elem
+
+        def collect(
+            name: str, stream: Iterator[Any], origin: Optional[_Branch]
+        ) -> None:
+            _, collector, args, kwargs = self.collectors[name]
+            value = results(until_stop(stream), collector, *args, **kwargs)
+            close(origin)
+            if not stop.is_set():
+                res[name] = value
+
+        live = set()
+        for node in reversed(self.nodes):
+            if node.sinks or any(child in live for child in node.children):
+                live.add(node)
+
+        inputs[self.root] = iter(self.source)
+        origins: Dict[Any, Optional[_Branch]] = {self.root: None}
+        for node in self.nodes:
+            if node not in inputs:
+                continue
+            stream = pipeline(inputs.pop(node), *node.operations)
+            origin = origins.pop(node)
+            children = [child for child in node.children if child in live]
+            consumers: List[Any] = [*children, *node.sinks]
+            if len(consumers) == 1:
+                inputs[consumers[0]] = stream
+                origins[consumers[0]] = origin
+            elif consumers:
+                branches = [_Branch(self.buffer) for _ in consumers]
+                for consumer, branch in zip(consumers, branches):
+                    inputs[consumer] = drain(branch)
+                    origins[consumer] = branch
+                guarded(distribute, stream, branches, origin)
+        for name in self.collectors:
+            guarded(collect, name, inputs.pop(name), origins.pop(name))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return res
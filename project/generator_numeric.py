@@ -0,0 +1,254 @@
+from typing import Any, Callable, Generator, Iterable, Iterator, Optional
+from array import array
+
+from project.generator import generate, batch_map, batch_filter
+from project.generator_collectors import Collector
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # type: ignore
+
+BACKENDS = ("array", "numpy")
+
+
+def _is_ndarray(chunk: Any) -> bool:
+    """
+    Check whether chunk is a NumPy array, False if NumPy is not installed.
+
+    Args:
+        chunk: Any: Chunk of a stream.
+
+    Returns:
+        bool: Chunk is a NumPy array.
+    """
+    return np is not None and isinstance(chunk, np.ndarray)
+
+
+def _tolist(chunk: Any) -> Any:
+    """
+    Convert NumPy chunk to a list of Python numbers, other chunks are returned as they are.
+
+    Args:
+        chunk: Any: Chunk of a stream.
+
+    Returns:
+        Any: Iterable of Python numbers.
+    """
+    return chunk.tolist() if _is_ndarray(chunk) else chunk
+
+
+def _array(typecode: str, values: Iterable[Any]) -> array:
+    """
+    Create array from values, it is faster to fill it from a list than from an iterator.
+
+    Args:
+        typecode: str: Typecode of array.
+        values: Iterable[Any]: Values.
+
+    Returns:
+        array: Array of values.
+    """
+    chunk = array(typecode)
+    chunk.fromlist(list(values))
+    return chunk
+
+
+def arange(
+    start: int,
+    end: int,
+    chunksize: int = 65536,
+    typecode: str = "q",
+    backend: Optional[str] = None,
+) -> Generator[Any, None, None]:
+    """
+    The function creates a lazy sequence of numeric chunks of numbers from start to end inclusive.
+
+    It is generate(start, end, chunksize) with every range chunk converted to a numeric array.
+
+    Args:
+        start: int: First integer value of the sequence.
+        end: int: Last integer value of the sequence (inclusive).
+        chunksize: int: Number of values in a chunk, the last chunk may be shorter.
+        typecode: str: Type of values, "q" for 64-bit integers and "d" for doubles.
+        backend: Optional[str]: "array" for array.array chunks, "numpy" for NumPy arrays,
+            NumPy if it is installed by default.
+
+    Yield:
+        Any: Next chunk of the range.
+
+    Raises:
+        ValueError: Chunksize is not positive or backend is unknown or not installed.
+
+    Mypy:
+        SendType: None - Not used.
+        ReturnType: None - Not used.
+    """
+
+    if chunksize < 1:
+        raise ValueError("Chunksize must be positive")
+    if backend is None:
+        backend = "array" if np is None else "numpy"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend}")
+    if backend == "numpy" and np is None:
+        raise ValueError("NumPy is not installed")
+
+    for chunk in generate(start, end, chunksize):
+        if backend == "numpy":
+            yield np.arange(chunk.start, chunk.stop, dtype=typecode)
+        else:
+            yield _array(typecode, chunk)
+
+
+def vmap(
+    func: Callable[[Any], Any], typecode: Optional[str] = None
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which applies func to every element of numeric chunks.
+
+    It is batch_map with an elementwise function instead of a function of chunks.
+    NumPy chunks are passed to func as a whole, so func must work with arrays like a ufunc
+    (arithmetic operators, NumPy functions). Elements of array.array chunks are mapped one by one.
+    Results must fit the typecode: NumPy integers wrap around, array.array raises OverflowError.
+
+    Args:
+        func: Callable[[Any], Any]: Elementwise function.
+        typecode: Optional[str]: Typecode of array.array results, the typecode of the chunk by default.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline over a stream of chunks.
+    """
+
+    def apply(chunk: Any) -> Any:
+        if _is_ndarray(chunk):
+            return func(chunk)
+        if isinstance(chunk, array):
+            return _array(typecode or chunk.typecode, map(func, chunk))
+        return list(map(func, chunk))
+
+    return batch_map(apply)
+
+
+def vfilter(
+    predicate: Callable[[Any], Any]
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which keeps elements of numeric chunks satisfying predicate.
+
+    It is batch_filter with an elementwise predicate instead of a function which returns
+    the mask of a chunk. For NumPy chunks predicate gets the whole chunk and returns a boolean mask.
+
+    Args:
+        predicate: Callable[[Any], Any]: Elementwise predicate.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline over a stream of chunks.
+    """
+
+    def mask(chunk: Any) -> Iterable[Any]:
+        return predicate(chunk) if _is_ndarray(chunk) else map(predicate, chunk)
+
+    return batch_filter(mask)
+
+
+def to_elements() -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which flattens numeric chunks into Python numbers.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline.
+    """
+
+    def operation(stream: Iterator[Any]) -> Generator[Any, None, None]:
+        for chunk in stream:
+            yield from _tolist(chunk)
+
+    return operation
+
+
+class ChunkCount(Collector):
+    """Number of elements in a stream of chunks."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add(self, chunk: Any) -> None:
+        self.count += len(chunk)
+
+    def result(self) -> int:
+        return self.count
+
+
+class ChunkSum(Collector):
+    """
+    Sum of elements in a stream of chunks.
+
+    Sums of integer NumPy chunks are exact: high and low 32 bits of elements are summed
+    separately, so 64-bit sums don't overflow.
+    """
+
+    def __init__(self) -> None:
+        self.total: Any = 0
+
+    def add(self, chunk: Any) -> None:
+        if not _is_ndarray(chunk):
+            self.total += sum(chunk)
+        elif chunk.dtype.kind in "iu":
+            high = (chunk >> 32).sum().item()
+            low = (chunk & 0xFFFFFFFF).sum().item()
+            self.total += (high << 32) + low
+        else:
+            self.total += chunk.sum().item()
+
+    def result(self) -> Any:
+        return self.total
+
+
+class ChunkMin(Collector):
+    """Minimum of elements in a stream of chunks, None for an empty stream."""
+
+    def __init__(self) -> None:
+        self.value: Any = None
+
+    def _reduce(self, chunk: Any) -> Any:
+        return chunk.min().item() if _is_ndarray(chunk) else min(chunk)
+
+    def _better(self, a: Any, b: Any) -> bool:
+        return a < b
+
+    def add(self, chunk: Any) -> None:
+        if not len(chunk):
+            return
+        value = self._reduce(chunk)
+        if self.value is None or self._better(value, self.value):
+            self.value = value
+
+    def result(self) -> Any:
+        return self.value
+
+
+class ChunkMax(ChunkMin):
+    """Maximum of elements in a stream of chunks, None for an empty stream."""
+
+    def _reduce(self, chunk: Any) -> Any:
+        return chunk.max().item() if _is_ndarray(chunk) else max(chunk)
+
+    def _better(self, a: Any, b: Any) -> bool:
+        return a > b
+
+
+class ChunkMean(Collector):
+    """Mean of elements in a stream of chunks, None for an empty stream."""
+
+    def __init__(self) -> None:
+        self.sum = ChunkSum()
+        self.count = ChunkCount()
+
+    def add(self, chunk: Any) -> None:
+        self.sum.add(chunk)
+        self.count.add(chunk)
+
+    def result(self) -> Optional[float]:
+        count = self.count.result()
+        return self.sum.result() / count if count else None
@@ -0,0 +1,240 @@
+from typing import Any, Callable, Deque, Generator, Iterator, Optional, Tuple
+from array import array
+from collections import deque
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+
+JOIN_TIMEOUT = 5.0
+
+
+class RingAllocator:
+    """
+    Allocator of contiguous regions of a ring buffer which are released in order of allocation.
+
+    Attributes:
+        capacity (int): Size of the buffer in bytes.
+        used (Deque[Tuple[int, int]]): Offsets and sizes of allocated regions, the oldest first.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.used: Deque[Tuple[int, int]] = deque()
+
+    def alloc(self, size: int) -> Optional[int]:
+        """
+        Allocate a region.
+
+        Args:
+            size (int): Size of the region in bytes.
+
+        Returns:
+            Optional[int]: Offset of the region or None if there is no free space now.
+
+        Raises:
+            ValueError: Region is larger than the buffer.
+        """
+        if size > self.capacity:
+            raise ValueError(f"Chunk of {size} bytes does not fit into ring buffer")
+        if not self.used:
+            offset = 0
+        else:
+            oldest = self.used[0][0]
+            end = self.used[-1][0] + self.used[-1][1]
+            if end > oldest and end + size <= self.capacity:
+                offset = end
+            elif end > oldest and size <= oldest:
+                offset = 0
+            elif end <= oldest and end + size <= oldest:
+                offset = end
+            else:
+                return None
+        self.used.append((offset, size))
+        return offset
+
+    def release(self) -> None:
+        """Release the oldest region."""
+        self.used.popleft()
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    """
+    The function returns the buffer of opened shared memory.
+
+    Args:
+        shm: SharedMemory: Shared memory.
+
+    Returns:
+        memoryview: Buffer.
+
+    Raises:
+        ValueError: Shared memory is closed.
+    """
+
+    buf = shm.buf
+    if buf is None:
+        raise ValueError("Shared memory is closed")
+    return buf
+
+
+def _write(shm: SharedMemory, offset: int, data: memoryview) -> None:
+    """
+    The function copies bytes of data into shared memory.
+
+    Args:
+        shm: SharedMemory: Shared memory.
+        offset: int: Offset in shared memory.
+        data: memoryview: Data.
+    """
+
+    raw = data.cast("B") if data.format != "B" or data.ndim != 1 else data
+    _buffer(shm)[offset : offset + raw.nbytes] = raw
+
+
+def _shm_worker(
+    conn: Connection,
+    in_name: str,
+    out_name: str,
+    func: Callable[[memoryview], Any],
+) -> None:
+    """
+    Apply func to chunks from the input ring and put results into the output ring.
+
+    Messages from parent: ("chunk", offset, size, typecode), ("release",), ("stop",).
+    Messages to parent: ("result", offset, size, typecode), ("error", exception).
+
+    Args:
+        conn(Connection): Worker side of the pipe.
+        in_name(str): Name of shared memory of the input ring.
+        out_name(str): Name of shared memory of the output ring.
+        func(Callable[[memoryview], Any]): Function of chunk which returns a buffer.
+    """
+    in_shm = SharedMemory(in_name)
+    out_shm = SharedMemory(out_name)
+    out_ring = RingAllocator(out_shm.size)
+    chunks: Deque[Tuple[Any, ...]] = deque()
+    try:
+        while True:
+            message = chunks.popleft() if chunks else conn.recv()
+            if message[0] == "stop":
+                break
+            if message[0] == "release":
+                out_ring.release()
+                continue
+            _, offset, size, typecode = message
+            view = _buffer(in_shm)[offset : offset + size].cast(typecode)
+            try:
+                res = memoryview(func(view))
+            except Exception as e:
+                conn.send(("error", e))
+                continue
+            finally:
+                view.release()
+            with res:
+                try:
+                    res_offset = out_ring.alloc(res.nbytes)
+                except ValueError as e:
+                    conn.send(("error", e))
+                    continue
+                while res_offset is None:
+                    message = conn.recv()
+                    if message[0] == "stop":
+                        return
+                    if message[0] == "release":
+                        out_ring.release()
+                        res_offset = out_ring.alloc(res.nbytes)
+                    else:
+                        chunks.append(message)
+                _write(out_shm, res_offset, res)
+                conn.send(("result", res_offset, res.nbytes, res.format))
+    finally:
+        in_shm.close()
+        out_shm.close()
+        conn.close()
+
+
+def shm_map(
+    func: Callable[[memoryview], Any],
+    capacity: int = 1 << 24,
+    max_in_flight: int = 8,
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which applies func to buffer chunks in another process.
+
+    Chunks (arrays or other buffers) are copied into a shared memory ring buffer and only offsets and
+    sizes go through a pipe. The worker calls func with a memoryview of the chunk in shared memory,
+    func returns a buffer (for example array) which is put into the output ring buffer. Results are
+    yielded as arrays in order of chunks. If the worker process dies, EOFError is raised and
+    shared memory is still unlinked.
+
+    Args:
+        func: Callable[[memoryview], Any]: Function of chunk which returns a buffer, it must be picklable.
+        capacity: int: Size of each of the two ring buffers in bytes.
+        max_in_flight: int: Maximum number of chunks sent to the worker and not yielded yet.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation for pipeline.
+
+    Raises:
+        ValueError: Capacity or max_in_flight is not positive.
+    """
+
+    if capacity < 1 or max_in_flight < 1:
+        raise ValueError("Capacity and max_in_flight must be positive")
+
+    def operation(stream: Iterator[Any]) -> Generator[Any, None, None]:
+        in_shm = SharedMemory(create=True, size=capacity)
+        out_shm = SharedMemory(create=True, size=capacity)
+        in_ring = RingAllocator(capacity)
+        conn, child_conn = Pipe()
+        proc = Process(
+            target=_shm_worker,
+            args=(child_conn, in_shm.name, out_shm.name, func),
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+
+        def receive() -> array:
+            message = conn.recv()
+            in_ring.release()
+            if message[0] == "error":
+                raise message[1]
+            _, offset, size, typecode = message
+            res = array(typecode)
+            res.frombytes(_buffer(out_shm)[offset : offset + size])
+            conn.send(("release",))
+            return res
+
+        try:
+            for chunk in stream:
+                data = memoryview(chunk)
+                offset = None
+                while True:
+                    if len(in_ring.used) < max_in_flight:
+                        offset = in_ring.alloc(data.nbytes)
+                    if offset is not None:
+                        break
+                    yield receive()
+                _write(in_shm, offset, data)
+                conn.send(("chunk", offset, data.nbytes, data.format))
+                data.release()
+            while in_ring.used:
+                yield receive()
+        finally:
+            try:
+                try:
+                    conn.send(("stop",))
+                except OSError:
+                    pass
+                proc.join(JOIN_TIMEOUT)
+                if proc.is_alive():
+                    proc.terminate()
+                    proc.join()
+                conn.close()
+            finally:
+                for shm in (in_shm, out_shm):
+                    shm.close()
+                    shm.unlink()
+
+    return operation
@@ -0,0 +1,171 @@
+from typing import Any, Generator, Optional, Tuple, Union
+from array import array
+import mmap
+import os
+import struct
+
+
+def _map_file(path: Union[str, os.PathLike]) -> Optional[mmap.mmap]:
+    """
+    The function maps a file into memory for reading.
+
+    Args:
+        path: Union[str, os.PathLike]: Path to the file.
+
+    Returns:
+        Optional[mmap.mmap]: Memory map of the file or None for an empty file.
+    """
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _unmap(mm: mmap.mmap) -> None:
+    """
+    The function closes a memory map if no memoryview of it is alive.
+
+    Otherwise the map is closed when the last memoryview is released.
+
+    Args:
+        mm: mmap.mmap: Memory map.
+    """
+
+    try:
+        mm.close()
+    except BufferError:
+        pass
+
+
+def read_lines(
+    path: Union[str, os.PathLike], encoding: str = "utf-8", keepends: bool = False
+) -> Generator[str, None, None]:
+    """
+    The function lazily reads lines of a text file through a memory map.
+
+    Args:
+        path: Union[str, os.PathLike]: Path to the file.
+        encoding: str: Encoding of the file.
+        keepends: bool: Keep line separators at the end of lines.
+
+    Yield:
+        str: Next line of the file.
+
+    Mypy:
+        SendType: None - Not used.
+        ReturnType: None - Not used.
+    """
+
+    mm = _map_file(path)
+    if mm is None:
+        return
+    try:
+        start = 0
+        size = len(mm)
+        while start < size:
+            end = mm.find(b"\n", start)
+            if end == -1:
+                end = size
+            else:
+                end += 1
+            line = mm[start:end]
+            if not keepends:
+                line = line.rstrip(b"\r\n")
+            yield line.decode(encoding)
+            start = end
+    finally:
+        _unmap(mm)
+
+
+def read_records(
+    path: Union[str, os.PathLike], fmt: str
+) -> Generator[Tuple[Any, ...], None, None]:
+    """
+    The function lazily reads fixed-size binary records of a file through a memory map.
+
+    Args:
+        path: Union[str, os.PathLike]: Path to the file.
+        fmt: str: Format of one record for the struct module.
+
+    Yield:
+        Tuple[Any, ...]: Next unpacked record.
+
+    Raises:
+        ValueError: File size is not a multiple of record size.
+
+    Mypy:
+        SendType: None - Not used.
+        ReturnType: None - Not used.
+    """
+
+    record = struct.Struct(fmt)
+    mm = _map_file(path)
+    if mm is None:
+        return
+    try:
+        if len(mm) % record.size:
+            raise ValueError("File size is not a multiple of record size")
+        view = memoryview(mm)
+        try:
+            yield from record.iter_unpack(view)
+        finally:
+            view.release()
+    finally:
+        _unmap(mm)
+
+
+def read_numbers(
+    path: Union[str, os.PathLike],
+    typecode: str = "d",
+    chunksize: int = 65536,
+    copy: bool = False,
+) -> Generator[Any, None, None]:
+    """
+    The function lazily reads a binary file of fixed-width numbers in native byte order in chunks.
+
+    By default chunks are memoryview slices of the memory map, so no data is copied,
+    a chunk stays valid while the consumer keeps a reference to it.
+
+    Args:
+        path: Union[str, os.PathLike]: Path to the file.
+        typecode: str: Typecode of numbers as in the array module.
+        chunksize: int: Number of numbers in a chunk, the last chunk may be shorter.
+        copy: bool: Yield arrays with copies of the numbers instead of memoryviews.
+
+    Yield:
+        Union[memoryview, array]: Next chunk of numbers.
+
+    Raises:
+        ValueError: Chunksize is not positive or file size is not a multiple of number size.
+
+    Mypy:
+        SendType: None - Not used.
+        ReturnType: None - Not used.
+    """
+
+    if chunksize < 1:
+        raise ValueError("Chunksize must be positive")
+    itemsize = array(typecode).itemsize
+    mm = _map_file(path)
+    if mm is None:
+        return
+    try:
+        if len(mm) % itemsize:
+            raise ValueError("File size is not a multiple of number size")
+        raw = memoryview(mm)
+        step = chunksize * itemsize
+        try:
+            for start in range(0, len(raw), step):
+                piece = raw[start : start + step]
+                if copy:
+                    chunk = array(typecode)
+                    chunk.frombytes(piece)
+                    piece.release()
+                    yield chunk
+                else:
+                    yield piece.cast(typecode)  # type: ignore[call-overload]
+        finally:
+            raw.release()
+    finally:
+        _unmap(mm)
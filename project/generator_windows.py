@@ -0,0 +1,205 @@
+from typing import Any, Callable, Deque, Generator, Iterator, Tuple
+from collections import OrderedDict, deque
+
+from project.generator_collectors import Collector, RemovableCollector
+
+
+class SlidingMin(RemovableCollector):
+    """
+    Minimum of a window, elements are removed in order of adding.
+
+    A monotonic deque keeps only elements which can still become the minimum.
+    """
+
+    def __init__(self) -> None:
+        self.candidates: Deque[Any] = deque()
+
+    def _before(self, a: Any, b: Any) -> bool:
+        return a <= b
+
+    def add(self, elem: Any) -> None:
+        candidates = self.candidates
+        while candidates and not self._before(candidates[-1], elem):
+            candidates.pop()
+        candidates.append(elem)
+
+    def remove(self, elem: Any) -> None:
+        if self.candidates and self.candidates[0] == elem:
+            self.candidates.popleft()
+
+    def result(self) -> Any:
+        return self.candidates[0] if self.candidates else None
+
+
+class SlidingMax(SlidingMin):
+    """Maximum of a window, elements are removed in order of adding."""
+
+    def _before(self, a: Any, b: Any) -> bool:
+        return a >= b
+
+
+def tumbling(
+    size: int, agg: Callable[[], Collector]
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which aggregates consecutive non-overlapping windows.
+
+    Args:
+        size: int: Number of elements in a window, the last window may be shorter.
+        agg: Callable[[], Collector]: Factory of collector for a window.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation which yields a result for every window.
+
+    Raises:
+        ValueError: Size is not positive.
+    """
+
+    if size < 1:
+        raise ValueError("Window size must be positive")
+
+    def operation(stream: Iterator[Any]) -> Generator[Any, None, None]:
+        collector = agg()
+        count = 0
+        for elem in stream:
+            collector.add(elem)
+            count += 1
+            if count == size:
+                yield collector.result()
+                collector = agg()
+                count = 0
+        if count:
+            yield collector.result()
+
+    return operation
+
+
+def sliding(
+    size: int, agg: Callable[[], RemovableCollector], step: int = 1
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which aggregates overlapping windows of the last size elements.
+
+    The aggregate is updated incrementally: entering elements are added and leaving ones are removed,
+    so agg must create removable collectors (Count, Sum, Mean, Variance, SlidingMin, SlidingMax).
+
+    Args:
+        size: int: Number of elements in a window.
+        agg: Callable[[], RemovableCollector]: Factory of collector.
+        step: int: Number of elements between consecutive windows.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation which yields a result for every full window.
+
+    Raises:
+        ValueError: Size or step is not positive.
+        TypeError: Collector can't remove elements.
+    """
+
+    if size < 1 or step < 1:
+        raise ValueError("Window size and step must be positive")
+    probe = agg()
+    if not isinstance(probe, RemovableCollector):
+        raise TypeError(f"{type(probe).__name__} can't remove elements")
+
+    def operation(stream: Iterator[Any]) -> Generator[Any, None, None]:
+        collector = agg()
+        window: Deque[Any] = deque()
+        since = 0
+        for elem in stream:
+            collector.add(elem)
+            window.append(elem)
+            if len(window) > size:
+                collector.remove(window.popleft())
+            if len(window) == size:
+                if since == 0:
+                    yield collector.result()
+                since = (since + 1) % step
+
+    return operation
+
+
+def session(
+    gap: Any, agg: Callable[[], Collector], key: Callable[[Any], Any] = lambda v: v
+) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """
+    The function creates a pipeline operation which aggregates sessions.
+
+    A session ends when key of the next element exceeds key of the previous one by more than gap.
+
+    Args:
+        gap: Any: Maximum distance between keys of neighbouring elements of a session.
+        agg: Callable[[], Collector]: Factory of collector for a session.
+        key: Callable[[Any], Any]: Position of element, for example its timestamp.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Any]]: Operation which yields a result for every session.
+    """
+
+    def operation(stream: Iterator[Any]) -> Generator[Any, None, None]:
+        collector = None
+        last = None
+        for elem in stream:
+            position = key(elem)
+            if collector is not None and position - last > gap:
+                yield collector.result()
+                collector = None
+            if collector is None:
+                collector = agg()
+            collector.add(elem)
+            last = position
+        if collector is not None:
+            yield collector.result()
+
+    return operation
+
+
+def group_by_window(
+    key: Callable[[Any], Any],
+    size: int,
+    agg: Callable[[], Collector],
+    max_keys: int = 1024,
+) -> Callable[[Iterator[Any]], Iterator[Tuple[Any, Any]]]:
+    """
+    The function creates a pipeline operation which aggregates tumbling windows separately for every key.
+
+    At most max_keys windows are open, when another key comes the least recently updated window
+    is closed early. Open windows are closed at the end of the stream.
+
+    Args:
+        key: Callable[[Any], Any]: Key of element.
+        size: int: Number of elements of one key in a window.
+        agg: Callable[[], Collector]: Factory of collector for a window.
+        max_keys: int: Maximum number of open windows.
+
+    Returns:
+        Callable[[Iterator[Any]], Iterator[Tuple[Any, Any]]]: Operation which yields pairs of key and result.
+
+    Raises:
+        ValueError: Size or max_keys is not positive.
+    """
+
+    if size < 1 or max_keys < 1:
+        raise ValueError("Window size and number of keys must be positive")
+
+    def operation(stream: Iterator[Any]) -> Generator[Tuple[Any, Any], None, None]:
+        windows: "OrderedDict[Any, list]" = OrderedDict()
+        for elem in stream:
+            k = key(elem)
+            window = windows.get(k)
+            if window is None:
+                if len(windows) == max_keys:
+                    old_key, (old, _) = windows.popitem(last=False)
+                    yield old_key, old.result()
+                window = windows[k] = [agg(), 0]
+            else:
+                windows.move_to_end(k)
+            window[0].add(elem)
+            window[1] += 1
+            if window[1] == size:
+                del windows[k]
+                yield k, window[0].result()
+        for k, (collector, _) in windows.items():
+            yield k, collector.result()
+
+    return operation
@@ -1,5 +1,82 @@
+import io
+from array import array
+import pickle
+import struct
+import sys
 from collections.abc import MutableMapping
-from typing import Any, List, Tuple, Iterator
+from typing import Any, BinaryIO, Callable, List, Optional, Tuple, Iterator, Type
+
+from project.hashtable_bloom import CountingBloomFilter
+
+DUMP_MAGIC = b"HTB2"
+DUMP_HEADER = struct.Struct("<4sQQqQ")
+DUMP_RECORD = struct.Struct("<QcQ")
+SEED_HASHED = frozenset(
+    {int, float, complex, bool, str, bytes}
+    | ({type(None)} if sys.version_info >= (3, 12) else set())
+)
+
+
+def _fingerprint() -> int:
+    """
+    Hash of fixed string, it differs between processes with different hash seeds.
+
+    Return:
+        int: Fingerprint of hash function.
+    """
+    return hash("project.hashtable")
+
+
+def _seed_hashed(key: Any) -> bool:
+    """
+    Check that hash of key depends only on its value and the hash seed, not on object identity.
+
+    Args:
+        key(Any): Key.
+
+    Return:
+        bool: True for numbers, strings, bytes and tuples or frozensets of them.
+    """
+    cls = type(key)
+    if cls in SEED_HASHED:
+        return True
+    if cls is tuple or cls is frozenset:
+        return all(_seed_hashed(k) for k in key)
+    return False
+
+
+def _read_exact(file: BinaryIO, size: int) -> bytes:
+    """
+    Read exact number of bytes.
+
+    Args:
+        file(BinaryIO): File.
+        size(int): Number of bytes.
+
+    Return:
+        bytes: Data.
+
+    Raise:
+        ValueError: If file ends too early.
+    """
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Unexpected end of hash table dump")
+    return data
+
+
+def _load_from_bytes(cls: Type["HashTable"], data: bytes) -> "HashTable":
+    """
+    Load hash table from dump in memory, it is used by pickle.
+
+    Args:
+        cls(Type[HashTable]): Class of hash table.
+        data(bytes): Dump.
+
+    Return:
+        HashTable: Loaded hash table.
+    """
+    return cls.load(io.BytesIO(data))
 
 
 class HashTable(MutableMapping):
@@ -10,20 +87,31 @@ class HashTable(MutableMapping):
         size(int): Number of items in hash table.
         num_slots(int): Number of slots.
         hash_table(List[List[Tuple[Any, Any]]]): Hash table.
+        bloom(Optional[CountingBloomFilter]): Filter which rejects most missing keys.
     """
 
-    def __init__(self, num_slots: int = 8):
+    BLOOM_COUNTERS_PER_SLOT = 8
+
+    def __init__(self, num_slots: int = 8, bloom: bool = False):
         """
         Initialization of hash table.
 
         Args:
             num_slots(int): Number of slots in hash table.
+            bloom(bool): Check keys with Bloom filter before searching the slot.
         """
         self.size = 0
         self.num_slots = num_slots
         self.hash_table: List[List[Tuple[Any, Any]]] = [
             [] for _ in range(self.num_slots)
         ]
+        self.bloom: Optional[CountingBloomFilter] = None
+        if bloom:
+            self._reset_bloom()
+
+    def _reset_bloom(self) -> None:
+        """Replace Bloom filter with an empty one sized for current number of slots."""
+        self.bloom = CountingBloomFilter(self.num_slots * self.BLOOM_COUNTERS_PER_SLOT)
 
     def _hash(self, key: Any) -> int:
         """
@@ -48,6 +136,8 @@ class HashTable(MutableMapping):
         self.num_slots = new_num_slots
         self.hash_table = [[] for _ in range(self.num_slots)]
         self.size = 0
+        if self.bloom is not None:
+            self._reset_bloom()
         for slot in old_hash_table:
             for k, v in slot:
                 self[k] = v
@@ -65,6 +155,8 @@ class HashTable(MutableMapping):
         Raise:
             KeyError: If key not found.
         """
+        if self.bloom is not None and hash(key) not in self.bloom:
+            raise KeyError(key)
         ind = self._hash(key)
         slot = self.hash_table[ind]
         for k, v in slot:
@@ -94,6 +186,8 @@ class HashTable(MutableMapping):
         if not fl:
             slot.append((key, value))
             self.size += 1
+            if self.bloom is not None:
+                self.bloom.add(hash(key))
 
     def __delitem__(self, key: Any) -> None:
         """
@@ -111,6 +205,8 @@ class HashTable(MutableMapping):
             if k == key:
                 slot.remove((k, v))
                 self.size -= 1
+                if self.bloom is not None:
+                    self.bloom.remove(hash(key))
                 return
         raise KeyError(key)
 
@@ -144,6 +240,8 @@ class HashTable(MutableMapping):
         Returns:
             bool: True, if key exist.
         """
+        if self.bloom is not None and hash(key) not in self.bloom:
+            return False
         ind = self._hash(key)
         slot = self.hash_table[ind]
         for k, _ in slot:
@@ -155,3 +253,114 @@ class HashTable(MutableMapping):
         """Remove all items."""
         self.hash_table = [[] for _ in range(self.num_slots)]
         self.size = 0
+        if self.bloom is not None:
+            self._reset_bloom()
+
+    def dump(self, file: BinaryIO, slots_per_record: int = 4096) -> None:
+        """
+        Write hash table to binary file in a compact format.
+
+        Slots are written in records of slots_per_record slots, so memory used for
+        writing does not depend on size of hash table. A record holds the lengths of
+        its slots as an array of bytes (of 32-bit numbers if a slot is longer than 255)
+        and one pickled flat list of keys and values of all its slots, so neither slot
+        lists nor item tuples are pickled. Counters of Bloom filter are written after
+        the records.
+
+        Args:
+            file(BinaryIO): File opened for binary writing.
+            slots_per_record(int): Number of slots in one record.
+        """
+        num_counters = self.bloom.num_counters if self.bloom is not None else 0
+        file.write(
+            DUMP_HEADER.pack(
+                DUMP_MAGIC, self.num_slots, self.size, _fingerprint(), num_counters
+            )
+        )
+        for start in range(0, self.num_slots, slots_per_record):
+            slots = self.hash_table[start : start + slots_per_record]
+            lengths = [len(slot) for slot in slots]
+            typecode = "B" if max(lengths) < 256 else "I"
+            items = [elem for slot in slots for item in slot for elem in item]
+            data = pickle.dumps(items, pickle.HIGHEST_PROTOCOL)
+            file.write(DUMP_RECORD.pack(len(slots), typecode.encode(), len(data)))
+            file.write(array(typecode, lengths).tobytes())
+            file.write(data)
+        if self.bloom is not None:
+            file.write(self.bloom.counters)
+
+    @classmethod
+    def load(cls, file: BinaryIO) -> "HashTable":
+        """
+        Read hash table written by dump.
+
+        If the hash function of this process is the same as of the writer and hashes of
+        all keys depend only on the hash seed (numbers, strings, bytes and tuples or
+        frozensets of them), slots are rebuilt from the lengths and Bloom filter counters
+        are used as they are, so keys are not rehashed. Otherwise all items are inserted
+        again: hashes of other keys (for example, objects hashed by identity) may differ
+        after unpickling.
+
+        Args:
+            file(BinaryIO): File opened for binary reading.
+
+        Return:
+            HashTable: Loaded hash table.
+
+        Raise:
+            ValueError: If file is not a hash table dump.
+        """
+        magic, num_slots, size, fingerprint, num_counters = DUMP_HEADER.unpack(
+            _read_exact(file, DUMP_HEADER.size)
+        )
+        if magic != DUMP_MAGIC:
+            raise ValueError("File is not a hash table dump")
+        same_hash = fingerprint == _fingerprint()
+
+        slots: List[List[Tuple[Any, Any]]] = []
+        while len(slots) < num_slots:
+            num_record_slots, typecode, num_bytes = DUMP_RECORD.unpack(
+                _read_exact(file, DUMP_RECORD.size)
+            )
+            lengths = array(typecode.decode())
+            lengths.frombytes(_read_exact(file, num_record_slots * lengths.itemsize))
+            items = pickle.loads(_read_exact(file, num_bytes))
+            if same_hash and not all(_seed_hashed(k) for k in items[::2]):
+                same_hash = False
+            pairs = list(zip(items[::2], items[1::2]))
+            start = 0
+            for length in lengths:
+                slots.append(pairs[start : start + length])
+                start += length
+        counters = _read_exact(file, num_counters) if num_counters else b""
+
+        table = cls.__new__(cls)
+        table.num_slots = num_slots
+        table.bloom = None
+        if same_hash:
+            table.hash_table = slots
+            table.size = size
+            if num_counters:
+                table.bloom = CountingBloomFilter(num_counters)
+                table.bloom.counters = bytearray(counters)
+            return table
+
+        table.hash_table = [[] for _ in range(num_slots)]
+        table.size = 0
+        if num_counters:
+            table._reset_bloom()
+        for slot in slots:
+            for k, v in slot:
+                table[k] = v
+        return table
+
+    def __reduce__(self) -> Tuple[Callable[..., Any], Tuple[Any, ...]]:
+        """
+        Pickle hash table through dump format.
+
+        Return:
+            Tuple[Callable[..., Any], Tuple[Any, ...]]: Loader and its arguments.
+        """
+        buffer = io.BytesIO()
+        self.dump(buffer)
+        return _load_from_bytes, (type(self), buffer.getvalue())
@@ -0,0 +1,87 @@
+class CountingBloomFilter:
+    """
+    Counting Bloom filter over hash values of keys.
+
+    Every position is a small counter instead of a bit, so keys can be removed.
+    A counter which reached its maximum is never decremented again.
+
+    Attributes:
+        num_counters(int): Number of counters.
+        num_probes(int): Number of counters checked for every key.
+    """
+
+    MAX_COUNT = 255
+
+    def __init__(self, num_counters: int, num_probes: int = 3):
+        """
+        Initialization of Bloom filter.
+
+        Args:
+            num_counters(int): Number of counters.
+            num_probes(int): Number of counters checked for every key.
+        """
+        self.num_counters = max(num_counters, 1)
+        self.num_probes = num_probes
+        self.counters = bytearray(self.num_counters)
+
+    def _positions(self, key_hash: int) -> range:
+        """
+        Find counter positions for hash with double hashing.
+
+        Args:
+            key_hash(int): Hash of key.
+
+        Return:
+            range: Positions before reduction modulo number of counters.
+        """
+        mixed = (key_hash * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        step = (mixed >> 32) | 1
+        return range(mixed, mixed + step * self.num_probes, step)
+
+    def add(self, key_hash: int) -> None:
+        """
+        Add key.
+
+        Args:
+            key_hash(int): Hash of key.
+        """
+        counters = self.counters
+        for pos in self._positions(key_hash):
+            pos %= self.num_counters
+            if counters[pos] < self.MAX_COUNT:
+                counters[pos] += 1
+
+    def remove(self, key_hash: int) -> None:
+        """
+        Remove key which was added before.
+
+        Args:
+            key_hash(int): Hash of key.
+        """
+        counters = self.counters
+        for pos in self._positions(key_hash):
+            pos %= self.num_counters
+            if 0 < counters[pos] < self.MAX_COUNT:
+                counters[pos] -= 1
+
+    def __contains__(self, key_hash: int) -> bool:
+        """
+        Check if key may exist.
+
+        Args:
+            key_hash(int): Hash of key.
+
+        Returns:
+            bool: False, if key surely does not exist.
+        """
+        counters = self.counters
+        n = self.num_counters
+        pos = (key_hash * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        if not counters[pos % n]:
+            return False
+        step = (pos >> 32) | 1
+        for _ in range(self.num_probes - 1):
+            pos += step
+            if not counters[pos % n]:
+                return False
+        return True
@@ -0,0 +1,333 @@
+from collections.abc import MutableMapping
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from project.hashtable import HashTable
+
+
+def _shard_worker(conn: Connection, num_slots: int) -> None:
+    """
+    Serve requests to one shard of sharded hash table.
+
+    Every request is a tuple (command, payload), every reply is a tuple (status, payload).
+
+    Args:
+        conn(Connection): Worker side of the pipe.
+        num_slots(int): Initial number of slots in shard.
+    """
+    table = HashTable(num_slots)
+    while True:
+        command, payload = conn.recv()
+        try:
+            if command == "stop":
+                conn.send(("ok", None))
+                break
+            elif command == "set_many":
+                for k, v in payload:
+                    table[k] = v
+                reply: Any = None
+            elif command == "get_many":
+                values = []
+                missing = []
+                for i, k in enumerate(payload):
+                    try:
+                        values.append(table[k])
+                    except KeyError:
+                        values.append(None)
+                        missing.append(i)
+                reply = (values, missing)
+            elif command == "del_many":
+                missing = []
+                for i, k in enumerate(payload):
+                    try:
+                        del table[k]
+                    except KeyError:
+                        missing.append(i)
+                reply = missing
+            elif command == "len":
+                reply = len(table)
+            elif command == "keys":
+                reply = list(table)
+            elif command == "clear":
+                table.clear()
+                reply = None
+            else:
+                raise ValueError(f"Unknown command {command}")
+        except Exception as e:
+            conn.send(("error", e))
+        else:
+            conn.send(("ok", reply))
+    conn.close()
+
+
+class ShardedHashTable(MutableMapping):
+    """
+    Key-value store partitioned by key hash across worker processes.
+
+    Every worker owns one HashTable shard. Batched methods send one message per shard,
+    so the cost of interprocess communication is shared by all keys of the batch.
+
+    Attributes:
+        num_shards(int): Number of shards (worker processes).
+    """
+
+    def __init__(self, num_shards: int = 2, num_slots: int = 8):
+        """
+        Initialization of sharded hash table.
+
+        Args:
+            num_shards(int): Number of worker processes.
+            num_slots(int): Initial number of slots in every shard.
+
+        Raise:
+            ValueError: If number of shards is not positive.
+        """
+        if num_shards < 1:
+            raise ValueError("Number of shards must be positive")
+        self.num_shards = num_shards
+        self._conns: List[Connection] = []
+        self._procs: List[Process] = []
+        for _ in range(num_shards):
+            parent_conn, child_conn = Pipe()
+            proc = Process(
+                target=_shard_worker, args=(child_conn, num_slots), daemon=True
+            )
+            proc.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._procs.append(proc)
+
+    def _shard(self, key: Any) -> int:
+        """
+        Find shard index.
+
+        Args:
+            key(Any): The key.
+
+        Return:
+            int: Index of shard which owns the key.
+        """
+        return hash(key) % self.num_shards
+
+    def _split(self, keys: Iterable[Any]) -> Dict[int, List[int]]:
+        """
+        Group positions of keys by shard.
+
+        Args:
+            keys(Iterable[Any]): Keys.
+
+        Return:
+            Dict[int, List[int]]: Positions of keys for every shard.
+        """
+        groups: Dict[int, List[int]] = {}
+        for i, key in enumerate(keys):
+            groups.setdefault(self._shard(key), []).append(i)
+        return groups
+
+    def _request(self, requests: Dict[int, Tuple[str, Any]]) -> Dict[int, Any]:
+        """
+        Send requests to shards and wait for all replies.
+
+        All requests are sent before the first reply is read, so shards work in parallel.
+        Requests are pickled before the first one is sent, so a request which can't be pickled
+        fails without leaving unread replies in the pipes.
+
+        Args:
+            requests(Dict[int, Tuple[str, Any]]): Request for every shard index.
+
+        Return:
+            Dict[int, Any]: Reply for every shard index.
+
+        Raise:
+            Exception: Error raised in a worker process or while pickling requests.
+        """
+        messages = {
+            shard: ForkingPickler.dumps(request) for shard, request in requests.items()
+        }
+        for shard, message in messages.items():
+            self._conns[shard].send_bytes(message)
+        replies = {}
+        error = None
+        for shard in requests:
+            status, payload = self._conns[shard].recv()
+            if status == "error":
+                error = payload
+            replies[shard] = payload
+        if error is not None:
+            raise error
+        return replies
+
+    def _broadcast(self, command: str) -> List[Any]:
+        """
+        Send the same command to every shard.
+
+        Args:
+            command(str): Command.
+
+        Return:
+            List[Any]: Replies of shards.
+        """
+        replies = self._request({i: (command, None) for i in range(self.num_shards)})
+        return [replies[i] for i in range(self.num_shards)]
+
+    def set_many(self, items: Iterable[Tuple[Any, Any]]) -> None:
+        """
+        Insert or update several items with one message per shard.
+
+        Args:
+            items(Iterable[Tuple[Any, Any]]): Pairs of key and value.
+        """
+        groups: Dict[int, List[Tuple[Any, Any]]] = {}
+        for k, v in items:
+            groups.setdefault(self._shard(k), []).append((k, v))
+        self._request({shard: ("set_many", group) for shard, group in groups.items()})
+
+    def get_many(self, keys: Iterable[Any], default: Any = None) -> List[Any]:
+        """
+        Get values of several keys with one message per shard.
+
+        Args:
+            keys(Iterable[Any]): Keys.
+            default(Any): Value for missing keys.
+
+        Return:
+            List[Any]: Values in order of keys.
+        """
+        keys = list(keys)
+        groups = self._split(keys)
+        replies = self._request(
+            {
+                shard: ("get_many", [keys[i] for i in positions])
+                for shard, positions in groups.items()
+            }
+        )
+        res = [default] * len(keys)
+        for shard, positions in groups.items():
+            values, missing = replies[shard]
+            for i, v in zip(positions, values):
+                res[i] = v
+            for j in missing:
+                res[positions[j]] = default
+        return res
+
+    def delete_many(self, keys: Iterable[Any]) -> List[Any]:
+        """
+        Remove several keys with one message per shard.
+
+        Args:
+            keys(Iterable[Any]): Keys.
+
+        Return:
+            List[Any]: Keys which were not found.
+        """
+        keys = list(keys)
+        groups = self._split(keys)
+        replies = self._request(
+            {
+                shard: ("del_many", [keys[i] for i in positions])
+                for shard, positions in groups.items()
+            }
+        )
+        missing = []
+        for shard, positions in groups.items():
+            for j in replies[shard]:
+                missing.append(keys[positions[j]])
+        return missing
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Get the value.
+
+        Args:
+            key(Any): Key.
+
+        Return:
+            Any: Value.
+
+        Raise:
+            KeyError: If key not found.
+        """
+        shard = self._shard(key)
+        values, missing = self._request({shard: ("get_many", [key])})[shard]
+        if missing:
+            raise KeyError(key)
+        return values[0]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """
+        Insert or update item.
+
+        Args:
+            key(Any): Key.
+            value(Any): Value.
+        """
+        self.set_many([(key, value)])
+
+    def __delitem__(self, key: Any) -> None:
+        """
+        Remove item.
+
+        Args:
+            key(Any): Key.
+
+        Raise:
+            KeyError: If key not found.
+        """
+        if self.delete_many([key]):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator:
+        """
+        Iterate all keys.
+
+        Return:
+            Iterator: Keys.
+        """
+        for keys in self._broadcast("keys"):
+            yield from keys
+
+    def __len__(self) -> int:
+        """
+        Get the number of items.
+
+        Return:
+            int: Number of items.
+        """
+        return sum(self._broadcast("len"))
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Check if key exist.
+
+        Args:
+            key(Any): Key.
+
+        Returns:
+            bool: True, if key exist.
+        """
+        shard = self._shard(key)
+        _, missing = self._request({shard: ("get_many", [key])})[shard]
+        return not missing
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._broadcast("clear")
+
+    def close(self) -> None:
+        """Stop worker processes."""
+        if not self._procs:
+            return
+        self._broadcast("stop")
+        for conn, proc in zip(self._conns, self._procs):
+            proc.join()
+            conn.close()
+        self._conns = []
+        self._procs = []
+
+    def __enter__(self) -> "ShardedHashTable":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,13 +1,40 @@
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import wraps
+import asyncio
 import inspect
+import math
+import threading
+import time
+
+from project import smart_args_metrics
+from project.smart_args_cow import cow, materialize
 
 
 class Isolated:
-    """Class indicates that argument must be copied"""
+    """
+    Class indicates that argument must be copied
+
+    With copy_on_write the function gets proxies (CowDict, CowList) which read the caller's
+    object and copy only the parts which are written. Proxies in the result of the function are
+    replaced with plain dicts and lists, so the result doesn't depend on the caller's object.
+    Proxies which the function keeps elsewhere still read the caller's object, so it must not
+    be changed while they are used.
+
+    Args:
+        copy_on_write (bool): Pass copy-on-write proxies of dicts and lists instead of deep copies.
+        copier (Optional[Callable[[Any], Any]]): Function which copies argument, for example
+            fast_copy, deepcopy by default.
+    """
 
-    pass
+    def __init__(
+        self, copy_on_write: bool = False, copier: Optional[Callable[[Any], Any]] = None
+    ) -> None:
+        if copy_on_write and copier is not None:
+            raise ValueError("Copy on write can't be used with a copier")
+        self.copy_on_write = copy_on_write
+        self.copier = deepcopy if copier is None else copier
 
 
 class Evaluated:
@@ -15,19 +42,124 @@ class Evaluated:
     Wraps dynamicly default value
 
     Args:
-        func (Callable[[], Any]): Returns value to use by default.
+        func (Callable[[], Any]): Returns value to use by default, it can be a coroutine
+            function for async functions.
+        ttl (Optional[float]): Number of seconds the produced value is reused, None to call
+            func on every call.
+        concurrent (bool): Evaluate on a thread pool together with other concurrent defaults.
     """
 
-    def __init__(self, func: Callable[[], Any]) -> None:
+    def __init__(
+        self,
+        func: Callable[[], Any],
+        ttl: Optional[float] = None,
+        concurrent: bool = False,
+    ) -> None:
         if not callable(func):
             raise TypeError("Must be initialized with a callable function.")
         self.func = func
+        self.ttl = ttl
+        self.concurrent = concurrent
+        self.is_async = inspect.iscoroutinefunction(func)
+        self._value: Any = None
+        self._expires = -math.inf
+        self._lock = threading.Lock()
+        self._refreshing: Dict[asyncio.AbstractEventLoop, "asyncio.Task[Any]"] = {}
+
+    def evaluate(self) -> Any:
+        """
+        Get the default value.
+
+        Returns:
+            Any: Cached value if it is not expired, otherwise the result of func.
+        """
+        if self.ttl is None:
+            return self.func()
+        with self._lock:
+            if time.monotonic() < self._expires:
+                return self._value
+            self._value = self.func()
+            self._expires = time.monotonic() + self.ttl
+            return self._value
+
+    async def evaluate_async(self) -> Any:
+        """
+        Get the default value of a coroutine function.
+
+        With ttl, concurrent callers in one event loop await a single call of func.
+
+        Returns:
+            Any: Cached value if it is not expired, otherwise the awaited result of func.
+        """
+        if self.ttl is None:
+            return await self.func()
+        if time.monotonic() < self._expires:
+            return self._value
+        loop = asyncio.get_running_loop()
+        task = self._refreshing.get(loop)
+        if task is None:
+            task = self._refreshing[loop] = loop.create_task(self._refresh(loop))
+        return await asyncio.shield(task)
+
+    async def _refresh(self, loop: asyncio.AbstractEventLoop) -> Any:
+        """
+        Await func and cache its result.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Loop which runs the refresh.
+
+        Returns:
+            Any: The result of func.
+        """
+        try:
+            self._value = await self.func()
+            self._expires = time.monotonic() + (self.ttl or 0.0)
+            return self._value
+        finally:
+            del self._refreshing[loop]
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool for concurrent Evaluated defaults.
+
+    Returns:
+        ThreadPoolExecutor: Thread pool shared by all decorated functions.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix="smart_args")
+    return _executor
+
+
+def _copier(default: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Get the function which copies an argument with this default.
+
+    Args:
+        default (Any): Isolated or Evaluated default value.
+
+    Returns:
+        Optional[Callable[[Any], Any]]: Copier of Isolated argument, None for Evaluated.
+    """
+    if not isinstance(default, Isolated):
+        return None
+    return cow if default.copy_on_write else default.copier
 
 
 def smart_args(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     Decorator which provides named Evaluated and Isolated
 
+    The signature is analyzed once, calls only process arguments with Isolated
+    and Evaluated defaults, other arguments are passed to the function as they are.
+    Missing concurrent Evaluated defaults are evaluated on a thread pool at the same time.
+    For async functions coroutine defaults are awaited together with asyncio.gather.
+    While SmartArgsMetrics are enabled, time of copying, evaluation and the call is recorded.
+
     Args:
         func (Callable[..., Any]): Function to decorate.
 
@@ -38,45 +170,186 @@ def smart_args(func: Callable[..., Any]) -> Callable[..., Any]:
         TypeError: smart args need named arguments
         TypeError: argument {name} must be Isolated
         TypeError: argument {name} is not provided
+        TypeError: argument {name} has async default in not async function
     Assert:
         AssertionError: argument {name} gets Evaluated object directly
         AssertionError: argument {name} gets Isolated object directly
 
     """
-    s = inspect.signature(func)
+    parameters = inspect.signature(func).parameters
+    names = frozenset(parameters)
+    required = frozenset(
+        name
+        for name, par in parameters.items()
+        if par.default is par.empty or isinstance(par.default, Isolated)
+    )
+    smart = tuple(
+        (name, _copier(par.default))
+        for name, par in parameters.items()
+        if isinstance(par.default, (Isolated, Evaluated))
+    )
+    isolated = tuple((name, copier) for name, copier in smart if copier is not None)
+    copied_names = tuple(name for name, copier in isolated if copier is not cow)
+    evaluated = [
+        (name, par.default)
+        for name, par in parameters.items()
+        if isinstance(par.default, Evaluated)
+    ]
+    sequential = tuple(
+        (name, ev) for name, ev in evaluated if not ev.concurrent and not ev.is_async
+    )
+    concurrent = tuple(
+        (name, ev) for name, ev in evaluated if ev.concurrent and not ev.is_async
+    )
+    coroutines = tuple((name, ev) for name, ev in evaluated if ev.is_async)
+    is_async = inspect.iscoroutinefunction(func)
+    has_sync_defaults = bool(sequential or concurrent)
 
-    @wraps(func)
-    def wrapped(*args: Any, **kwargs: Any) -> Any:
-        if args:
-            raise TypeError("Error: smart args need named arguments")
+    call = func
+    if any(
+        par.default.copy_on_write
+        for par in parameters.values()
+        if isinstance(par.default, Isolated)
+    ):
+        if is_async:
 
-        kwargs_new = {}
-        for name, par in s.parameters.items():
+            async def call(**kwargs: Any) -> Any:
+                return materialize(await func(**kwargs))
 
-            if name in kwargs:
-                value = kwargs[name]
-                if isinstance(par.default, Isolated):
-                    value = deepcopy(value)
-                assert not isinstance(
-                    value, Evaluated
-                ), f"Error: argument {name} gets Evaluated object directly"
-                assert not isinstance(
-                    value, Isolated
-                ), f"Error: argument {name} gets Isolated object directly"
+        else:
+
+            def call(**kwargs: Any) -> Any:
+                return materialize(func(**kwargs))
+
+    if coroutines and not is_async:
+        raise TypeError(
+            f"Error: argument {coroutines[0][0]} has async default in not async function"
+        )
 
+    def missing(kwargs: Dict[str, Any]) -> None:
+        for name, par in parameters.items():
+            if name in kwargs:
+                if isinstance(par.default, (Isolated, Evaluated)):
+                    check(name, kwargs[name])
             else:
-                default = par.default
-                if isinstance(default, Evaluated):
-                    value = default.func()
-                elif isinstance(default, Isolated):
+                if isinstance(par.default, Isolated):
                     raise TypeError(f"Error: argument {name} must be Isolated")
-                elif default is par.empty:
+                if par.default is par.empty:
                     raise TypeError(f"Error: argument {name} is not provided")
-                else:
-                    value = default
 
-            kwargs_new[name] = value
+    def check(name: str, value: Any) -> None:
+        assert not isinstance(
+            value, Evaluated
+        ), f"Error: argument {name} gets Evaluated object directly"
+        assert not isinstance(
+            value, Isolated
+        ), f"Error: argument {name} gets Isolated object directly"
+
+    qualname = f"{func.__module__}.{func.__qualname__}"
+
+    def prepare(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if args:
+            raise TypeError("Error: smart args need named arguments")
+        if not names >= kwargs.keys():
+            kwargs = {name: kwargs[name] for name in names if name in kwargs}
+        if not required <= kwargs.keys():
+            missing(kwargs)
+
+        for name, copier in smart:
+            if copier is not None:
+                value = kwargs[name]
+                check(name, value)
+                kwargs[name] = copier(value)
+            elif name in kwargs:
+                check(name, kwargs[name])
+        return kwargs
+
+    def evaluate(kwargs: Dict[str, Any]) -> None:
+        for name, ev in sequential:
+            if name not in kwargs:
+                kwargs[name] = ev.evaluate()
+        pending = [(name, ev) for name, ev in concurrent if name not in kwargs]
+        if len(pending) == 1:
+            name, ev = pending[0]
+            kwargs[name] = ev.evaluate()
+        elif pending:
+            executor = _get_executor()
+            futures = [(name, executor.submit(ev.evaluate)) for name, ev in pending]
+            for name, future in futures:
+                kwargs[name] = future.result()
+
+    async def evaluate_async(kwargs: Dict[str, Any]) -> None:
+        for name, ev in sequential:
+            if name not in kwargs:
+                kwargs[name] = ev.evaluate()
+        loop = asyncio.get_running_loop()
+        pending: List[Tuple[str, Awaitable[Any]]] = [
+            (name, ev.evaluate_async()) for name, ev in coroutines if name not in kwargs
+        ]
+        pending.extend(
+            (name, loop.run_in_executor(_get_executor(), ev.evaluate))
+            for name, ev in concurrent
+            if name not in kwargs
+        )
+        if pending:
+            values = await asyncio.gather(*(task for _, task in pending))
+            kwargs.update(zip((name for name, _ in pending), values))
+
+    if is_async:
+
+        @wraps(func)
+        async def wrapped_async(*args: Any, **kwargs: Any) -> Any:
+            metrics = smart_args_metrics.active
+            if metrics is None:
+                kwargs = prepare(args, kwargs)
+                await evaluate_async(kwargs)
+                return await call(**kwargs)
+
+            start = time.perf_counter()
+            kwargs = prepare(args, kwargs)
+            copied = time.perf_counter()
+            sizes = metrics.sample(qualname, (kwargs[name] for name in copied_names))
+            sampled = time.perf_counter()
+            await evaluate_async(kwargs)
+            evaluated = time.perf_counter()
+            try:
+                return await call(**kwargs)
+            finally:
+                metrics.record(
+                    qualname,
+                    copied - start,
+                    evaluated - sampled,
+                    time.perf_counter() - evaluated,
+                    sizes,
+                )
+
+        return wrapped_async
+
+    @wraps(func)
+    def wrapped(*args: Any, **kwargs: Any) -> Any:
+        metrics = smart_args_metrics.active
+        if metrics is None:
+            kwargs = prepare(args, kwargs)
+            if has_sync_defaults:
+                evaluate(kwargs)
+            return call(**kwargs)
 
-        return func(**kwargs_new)
+        start = time.perf_counter()
+        kwargs = prepare(args, kwargs)
+        copied = time.perf_counter()
+        sizes = metrics.sample(qualname, (kwargs[name] for name in copied_names))
+        sampled = time.perf_counter()
+        evaluate(kwargs)
+        evaluated = time.perf_counter()
+        try:
+            return call(**kwargs)
+        finally:
+            metrics.record(
+                qualname,
+                copied - start,
+                evaluated - sampled,
+                time.perf_counter() - evaluated,
+                sizes,
+            )
 
     return wrapped
@@ -0,0 +1,63 @@
+from typing import Any, Callable, Dict, Set
+from copy import deepcopy
+
+ATOMIC = frozenset({int, float, complex, str, bytes, bool, type(None)})
+
+Copier = Callable[[Any, Callable[[Any], Any]], Any]
+
+COPIERS: Dict[type, Copier] = {
+    dict: lambda value, copy: {k: copy(v) for k, v in value.items()},
+    list: lambda value, copy: [copy(v) for v in value],
+    tuple: lambda value, copy: tuple([copy(v) for v in value]),
+    set: lambda value, copy: {copy(v) for v in value},
+    frozenset: lambda value, copy: frozenset([copy(v) for v in value]),
+}
+
+
+class _NotTree(Exception):
+    """Value has shared or cyclic containers or values of not registered types."""
+
+
+def register_copier(cls: type, copier: Copier) -> None:
+    """
+    Register copy function for values of exactly this type.
+
+    Args:
+        cls (type): Type of values.
+        copier (Copier): Function of value and copy function, it must copy nested
+            values with copy(nested).
+    """
+    COPIERS[cls] = copier
+
+
+def fast_copy(value: Any) -> Any:
+    """
+    Deep copy without memo for tree-shaped JSON-like structures.
+
+    Containers of registered types (dict, list, tuple, set by default) are copied by
+    type-specialized functions. Only ids of copied containers are remembered: if a container
+    is met twice (it is shared or there is a cycle) or a value of not registered type is met,
+    the whole value is copied with deepcopy, so the result is always the same as of deepcopy.
+
+    Args:
+        value (Any): Value to copy.
+
+    Returns:
+        Any: Copy of value.
+    """
+    seen: Set[int] = set()
+
+    def copy(value: Any) -> Any:
+        cls = type(value)
+        if cls in ATOMIC:
+            return value
+        copier = COPIERS.get(cls)
+        if copier is None or id(value) in seen:
+            raise _NotTree
+        seen.add(id(value))
+        return copier(value, copy)
+
+    try:
+        return copy(value)
+    except _NotTree:
+        return deepcopy(value)
@@ -0,0 +1,216 @@
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Union,
+    overload,
+)
+from copy import deepcopy
+
+IMMUTABLE = (int, float, complex, str, bytes, bool, type(None))
+
+
+def cow(value: Any) -> Any:
+    """
+    Isolate a value with copy-on-write proxies.
+
+    Dicts and lists are wrapped into proxies which copy only the level which is written,
+    values of immutable types are returned as they are, other values are deep copied.
+
+    Args:
+        value (Any): Value to isolate.
+
+    Returns:
+        Any: Proxy, the value itself or its deep copy.
+    """
+    if isinstance(value, IMMUTABLE):
+        return value
+    if type(value) is dict:
+        return CowDict(value)
+    if type(value) is list:
+        return CowList(value)
+    return deepcopy(value)
+
+
+def materialize(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Replace copy-on-write proxies in value with plain dicts and lists.
+
+    Proxies become independent of their sources. Dicts and lists which contain proxies
+    are updated in place, tuples are rebuilt.
+
+    Args:
+        value (Any): Value, for example the result of a function with proxy arguments.
+        memo (Optional[Dict[int, Any]]): Already processed containers by id.
+
+    Returns:
+        Any: Value without proxies.
+    """
+    if isinstance(value, IMMUTABLE):
+        return value
+    if memo is None:
+        memo = {}
+    if id(value) in memo:
+        return memo[id(value)]
+
+    res: Any
+    if isinstance(value, CowDict):
+        res = memo[id(value)] = {}
+        for key in value:
+            res[key] = materialize(value[key], memo)
+    elif isinstance(value, CowList):
+        res = memo[id(value)] = []
+        for item in value:
+            res.append(materialize(item, memo))
+    elif type(value) is dict:
+        res = memo[id(value)] = value
+        for key, item in value.items():
+            value[key] = materialize(item, memo)
+    elif type(value) is list:
+        res = memo[id(value)] = value
+        for i, item in enumerate(value):
+            value[i] = materialize(item, memo)
+    elif type(value) is tuple:
+        memo[id(value)] = value
+        res = memo[id(value)] = tuple(materialize(item, memo) for item in value)
+    else:
+        res = value
+    return res
+
+
+class CowDict(MutableMapping):
+    """
+    Copy-on-write proxy of a dict.
+
+    Reads go to the source dict, nested dicts and lists are wrapped into proxies on access.
+    The first write copies this level of the source, the source is never changed.
+    The source must not be changed while the proxy is used.
+
+    Args:
+        source (dict): The original dict.
+    """
+
+    __slots__ = ("_source", "_data", "_children")
+
+    def __init__(self, source: dict) -> None:
+        self._source = source
+        self._data: Optional[dict] = None
+        self._children: Dict[Any, Any] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        if self._data is not None:
+            return self._data[key]
+        try:
+            return self._children[key]
+        except KeyError:
+            value = self._children[key] = cow(self._source[key])
+            return value
+
+    def _materialize(self) -> dict:
+        if self._data is None:
+            children = self._children
+            self._data = {
+                key: children[key] if key in children else cow(value)
+                for key, value in self._source.items()
+            }
+            self._children = {}
+        return self._data
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._materialize()[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self._materialize()[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._source if self._data is None else self._data)
+
+    def __len__(self) -> int:
+        return len(self._source if self._data is None else self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in (self._source if self._data is None else self._data)
+
+    def __repr__(self) -> str:
+        return f"CowDict({dict(self.items())!r})"
+
+
+class CowList(MutableSequence):
+    """
+    Copy-on-write proxy of a list.
+
+    Reads go to the source list, nested dicts and lists are wrapped into proxies on access.
+    The first write copies this level of the source, the source is never changed.
+    The source must not be changed while the proxy is used.
+
+    Args:
+        source (list): The original list.
+    """
+
+    __slots__ = ("_source", "_data", "_children")
+
+    def __init__(self, source: list) -> None:
+        self._source = source
+        self._data: Optional[list] = None
+        self._children: Dict[int, Any] = {}
+
+    def _item(self, index: int) -> Any:
+        if index < 0:
+            index += len(self._source)
+        if not 0 <= index < len(self._source):
+            raise IndexError("list index out of range")
+        try:
+            return self._children[index]
+        except KeyError:
+            value = self._children[index] = cow(self._source[index])
+            return value
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if self._data is not None:
+            return self._data[index]
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self._source)))]
+        return self._item(index)
+
+    def _materialize(self) -> list:
+        if self._data is None:
+            self._data = [self._item(i) for i in range(len(self._source))]
+            self._children = {}
+        return self._data
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._materialize()[index] = value
+
+    def __delitem__(self, index: Any) -> None:
+        del self._materialize()[index]
+
+    def insert(self, index: int, value: Any) -> None:
+        self._materialize().insert(index, value)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._data is not None:
+            return iter(self._data)
+        return (self._item(i) for i in range(len(self._source)))
+
+    def __len__(self) -> int:
+        return len(self._source if self._data is None else self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (list, CowList)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"CowList({list(self)!r})"
@@ -0,0 +1,177 @@
+from typing import Any, Dict, Iterable, List, Optional
+import sys
+
+active: Optional["SmartArgsMetrics"] = None
+
+
+def deep_size(value: Any) -> int:
+    """
+    Approximate memory size of value with nested dicts, lists, tuples and sets.
+
+    Args:
+        value (Any): Value to measure.
+
+    Returns:
+        int: Size in bytes, shared objects are counted once.
+    """
+    seen = set()
+    stack = [value]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return size
+
+
+class FunctionStats:
+    """
+    Statistics of calls of one function decorated with smart_args.
+
+    Attributes:
+        name (str): Qualified name of the function.
+        calls (int): Number of finished calls.
+        started (int): Number of started calls, it decides which calls are sampled.
+        copy_time (float): Time spent in checking and copying arguments.
+        eval_time (float): Time spent in evaluating defaults.
+        callee_time (float): Time spent in the function.
+        size_samples (int): Number of sampled sizes of copied arguments.
+        total_size (int): Sum of sampled sizes in bytes.
+        max_size (int): Maximum sampled size in bytes.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.started = 0
+        self.copy_time = 0.0
+        self.eval_time = 0.0
+        self.callee_time = 0.0
+        self.size_samples = 0
+        self.total_size = 0
+        self.max_size = 0
+
+    @property
+    def mean_size(self) -> float:
+        """Mean sampled size of copied arguments in bytes."""
+        return self.total_size / self.size_samples if self.size_samples else 0.0
+
+
+class SmartArgsMetrics:
+    """
+    Metrics of functions decorated with smart_args, collected while they are enabled.
+
+    Metrics are enabled with enable() or in a with block. When they are disabled,
+    decorated functions only check that no metrics are active.
+
+    Args:
+        sample_every (int): Size of copied arguments is measured on every sample_every call.
+
+    Attributes:
+        functions (Dict[str, FunctionStats]): Statistics by function name.
+    """
+
+    def __init__(self, sample_every: int = 100) -> None:
+        if sample_every < 1:
+            raise ValueError("Sample period must be positive")
+        self.sample_every = sample_every
+        self.functions: Dict[str, FunctionStats] = {}
+
+    def enable(self) -> "SmartArgsMetrics":
+        """Start collecting metrics into this object instead of the active one."""
+        global active
+        active = self
+        return self
+
+    def disable(self) -> None:
+        """Stop collecting metrics."""
+        global active
+        if active is self:
+            active = None
+
+    def __enter__(self) -> "SmartArgsMetrics":
+        return self.enable()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.disable()
+
+    def _stats(self, name: str) -> FunctionStats:
+        stats = self.functions.get(name)
+        if stats is None:
+            stats = self.functions[name] = FunctionStats(name)
+        return stats
+
+    def sample(self, name: str, copies: Iterable[Any]) -> List[int]:
+        """
+        Measure sizes of copied arguments if the current call of a function is sampled.
+
+        It must be called straight after copying, before the function can change the copies.
+        Copy-on-write proxies must not be passed: their size is not the size of the copied data.
+
+        Args:
+            name (str): Qualified name of the function.
+            copies (Iterable[Any]): Copied arguments.
+
+        Returns:
+            List[int]: Sizes in bytes, empty if the call is not sampled.
+        """
+        stats = self._stats(name)
+        stats.started += 1
+        if (stats.started - 1) % self.sample_every:
+            return []
+        return [deep_size(value) for value in copies]
+
+    def record(
+        self,
+        name: str,
+        copy_time: float,
+        eval_time: float,
+        callee_time: float,
+        sizes: Iterable[int],
+    ) -> None:
+        """
+        Add a call of a function.
+
+        Args:
+            name (str): Qualified name of the function.
+            copy_time (float): Time spent in checking and copying arguments.
+            eval_time (float): Time spent in evaluating defaults.
+            callee_time (float): Time spent in the function.
+            sizes (Iterable[int]): Sizes of copied arguments returned by sample().
+        """
+        stats = self._stats(name)
+        for size in sizes:
+            stats.size_samples += 1
+            stats.total_size += size
+            stats.max_size = max(stats.max_size, size)
+        stats.calls += 1
+        stats.copy_time += copy_time
+        stats.eval_time += eval_time
+        stats.callee_time += callee_time
+
+    def summary(self) -> str:
+        """
+        Format statistics as a table.
+
+        Returns:
+            str: Table with a row for every function.
+        """
+
+        rows = [
+            f"{'function':<32} {'calls':>8} {'copy, s':>10} {'eval, s':>10} "
+            f"{'callee, s':>10} {'mean size':>10} {'max size':>10}"
+        ]
+        for st in self.functions.values():
+            rows.append(
+                f"{st.name[-32:]:<32} {st.calls:>8} {st.copy_time:>10.4f} "
+                f"{st.eval_time:>10.4f} {st.callee_time:>10.4f} "
+                f"{st.mean_size:>10.0f} {st.max_size:>10}"
+            )
+        return "\n".join(rows)
@@ -1,6 +1,6 @@
 import pytest
 
-from project.curry import curry_explicit, uncurry_explicit
+from project.curry import curry_explicit, uncurry_explicit, Curried, MAX_COMPILED_ARITY
 
 
 def test_curry_and_uncurry():
@@ -138,3 +138,190 @@ def test_curry_built_in_function():
     assert curry_len(vec) == 4
     curry_pow = curry_explicit(pow, 2)
     assert curry_pow(5)(3) == 125
+
+
+def test_curry_partial_applications_are_independent():
+    """Test that partial applications share arguments without affecting each other"""
+
+    curry = curry_explicit(lambda *args: args, 4)
+    base = curry(1, 2)
+    left = base(3)
+    right = base(30)
+    assert left(4) == (1, 2, 3, 4)
+    assert right(40) == (1, 2, 30, 40)
+    assert left(5) == (1, 2, 3, 5)
+
+
+def test_curry_large_arity():
+    """Test curry of function with many arguments"""
+
+    curry = curry_explicit(lambda *args: sum(args), 64)
+    for i in range(64):
+        curry = curry(i)
+    assert curry == sum(range(64))
+
+
+@pytest.mark.parametrize("arity", [1, 2, 3, 64])
+def test_compiled_curry(arity):
+    """Test that compiled curry gives the same results"""
+
+    curry = curry_explicit(lambda *args: args, arity, compiled=True)
+    for i in range(arity):
+        curry = curry(i)
+    assert curry == tuple(range(arity))
+
+
+def test_compiled_curry_several_arguments():
+    """Test compiled curry with several arguments at the first call"""
+
+    curry = curry_explicit(lambda x, y, z: x * y - z, 3, compiled=True)
+    assert curry(2, 3)(4) == 2
+    assert curry(2, 3, 4) == 2
+    assert curry(2)(3)(4) == 2
+    with pytest.raises(TypeError) as excinfo:
+        curry(1, 2, 3, 4)
+    assert str(excinfo.value) == "More arguments than expected"
+    with pytest.raises(TypeError):
+        curry(1)(2, 3)
+
+
+def test_compiled_curry_errors_and_zero_arity():
+    """Test compiled curry with zero and negative arity"""
+
+    assert curry_explicit(lambda: 5, 0, compiled=True)() == 5
+    with pytest.raises(ValueError) as excinfo:
+        curry_explicit(print, -1, compiled=True)
+    assert str(excinfo.value) == "Arity can't be negative"
+
+
+def test_compiled_curry_code_is_cached():
+    """Test that code is generated once per arity"""
+
+    first = curry_explicit(pow, 2, compiled=True)
+    second = curry_explicit(divmod, 2, compiled=True)
+    assert first.__code__ is second.__code__
+    assert first(2)(10) == 1024
+    assert second(7)(2) == (3, 1)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_uncurry_calls_original_function(compiled):
+    """Test that uncurry of curried function calls the original function directly"""
+
+    def f(x, y, z):
+        return x + y * z
+
+    uncurry = uncurry_explicit(curry_explicit(f, 3, compiled=compiled), 3)
+    assert uncurry.function is f
+    assert uncurry(1, 2, 3) == 7
+    with pytest.raises(TypeError) as excinfo:
+        uncurry(1, 2)
+    assert str(excinfo.value) == "Error: expected 3 arguments, but got 2 arguments"
+
+
+def test_curry_uncurry_round_trip():
+    """Test that round trips curry the original function"""
+
+    def f(x, y):
+        return x - y
+
+    curry = curry_explicit(uncurry_explicit(curry_explicit(f, 2), 2), 2)
+    assert curry.function is f
+    assert curry(5)(3) == 2
+    assert curry_explicit(curry, 2).function is f
+    assert uncurry_explicit(curry, 2)(5, 3) == 2
+
+
+def test_uncurry_other_arity_applies_arguments():
+    """Test that uncurry with another arity still applies arguments one by one"""
+
+    curry = curry_explicit(lambda x, y, z: (x, y, z), 3)
+    uncurry = uncurry_explicit(curry, 2)
+    assert uncurry(1, 2)(3) == (1, 2, 3)
+
+
+def test_memoized_curry_caches_results():
+    """Test that memoized curry calls the function once for the same arguments"""
+
+    calls = []
+
+    def f(x, y, z):
+        calls.append((x, y, z))
+        return x + y + z
+
+    curry = curry_explicit(f, 3, memoize=True)
+    assert curry(1)(2)(3) == 6
+    assert curry(1, 2)(3) == 6
+    assert curry(1, 2, 3) == 6
+    assert uncurry_explicit(curry, 3)(1, 2, 3) == 6
+    assert calls == [(1, 2, 3)]
+    assert curry.stats.hits == 3
+    assert curry.stats.misses == 1
+
+
+def test_memoized_curry_shares_prefixes():
+    """Test that partial applications with the same leading arguments are shared"""
+
+    curry = curry_explicit(lambda *args: args, 4, memoize=True)
+    assert curry(1)(2) is curry(1, 2)
+    assert curry(1)(2) is not curry(1)(3)
+    assert curry(1)(2)(3)(4) == (1, 2, 3, 4)
+    assert curry.stats.partial_misses == 4
+    assert curry.stats.partial_hits == 7
+
+
+def test_memoized_curry_eviction():
+    """Test that caches are bounded"""
+
+    curry = curry_explicit(lambda x, y, z: x * y * z, 3, memoize=True, cache_size=4)
+    for i in range(10):
+        assert curry(i)(i)(2) == 2 * i * i
+    assert len(curry.results) == 4
+    assert len(curry.partials) <= 4
+    assert curry.stats.evictions > 0
+    assert curry(9)(9)(2) == 162
+    assert curry.stats.hits == 1
+
+    curry.cache_clear()
+    assert not curry.results and not curry.partials
+    assert curry(9, 9, 2) == 162
+    assert curry.stats.misses == 11
+
+
+def test_memoized_curry_errors():
+    """Test errors of memoized curry"""
+
+    curry = curry_explicit(lambda x, y: x - y, 2, memoize=True)
+    with pytest.raises(TypeError) as excinfo:
+        curry(1, 2, 3)
+    assert str(excinfo.value) == "More arguments than expected"
+    with pytest.raises(TypeError):
+        curry(1)(2, 3)
+    with pytest.raises(ValueError):
+        curry_explicit(pow, 2, compiled=True, memoize=True)
+    assert curry_explicit(lambda: 1, 0, memoize=True)() == 1
+
+
+def test_memoized_curry_clear_with_held_partials():
+    """Test partial applications held by the caller after cache_clear"""
+
+    curry = curry_explicit(lambda x, y, z: x + y + z, 3, memoize=True, cache_size=2)
+    partial = curry(1)
+    assert partial(2)(3) == 6
+    curry.cache_clear()
+    assert partial(2)(3) == 6
+    for i in range(5):
+        curry(i, i)
+    assert partial(2)(4) == 7
+    assert curry(1)(2)(3) == 6
+
+
+@pytest.mark.parametrize("arity", [MAX_COMPILED_ARITY, MAX_COMPILED_ARITY + 1, 200])
+def test_compiled_curry_large_arity(arity):
+    """Test that compiled curry falls back to Curried above the limit"""
+
+    curry = curry_explicit(lambda *args: sum(args), arity, compiled=True)
+    assert isinstance(curry, Curried) == (arity > MAX_COMPILED_ARITY)
+    for i in range(arity):
+        curry = curry(i)
+    assert curry == sum(range(arity))
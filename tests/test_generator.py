@@ -1,7 +1,25 @@
 import pytest
+import threading
+import time
 from functools import reduce
 from typing import Any, Generator, List
-from project.generator import generate, pipeline, results
+from project.generator import (
+    generate,
+    pipeline,
+    results,
+    parallel_map,
+    threaded,
+    batch,
+    unbatch,
+    batch_map,
+    batch_filter,
+    Map,
+    Filter,
+    FlatMap,
+    fuse,
+    PipelineProfile,
+)
+from array import array
 
 
 def map_of_square(x):
@@ -145,3 +163,275 @@ def test_lazy_eval(val, operation, first_elem):
     first = next(res)
     assert first == first_elem
     assert number["count"] == 1
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_parallel_map_ordered(executor, chunksize):
+    """Test ordered parallel map"""
+    res = pipeline(
+        generate(-20, 20), parallel_map(abs, 2, chunksize, executor=executor)
+    )
+    assert list(res) == [abs(v) for v in range(-20, 21)]
+
+
+def test_parallel_map_unordered():
+    """Test unordered parallel map"""
+    res = pipeline(
+        generate(1, 50),
+        parallel_map(lambda v: v * 2, 3, 4, ordered=False, executor="thread"),
+    )
+    assert sorted(res) == list(range(2, 101, 2))
+
+
+def test_parallel_map_lazy():
+    """Test that parallel map reads bounded number of chunks"""
+    number = {"count": 0}
+
+    def count(stream):
+        for elem in stream:
+            number["count"] += 1
+            yield elem
+
+    res = pipeline(generate(1, 1000), count, parallel_map(str, 2, 5, executor="thread"))
+    assert number["count"] == 0
+    assert next(res) == "1"
+    assert number["count"] <= 2 * 2 * 5 + 5
+    res.close()
+
+
+def test_parallel_map_error():
+    """Test errors of parallel map"""
+
+    def fail(v):
+        raise ZeroDivisionError
+
+    with pytest.raises(ZeroDivisionError):
+        list(pipeline(generate(1, 10), parallel_map(fail, executor="thread")))
+    with pytest.raises(ValueError):
+        parallel_map(abs, executor="gpu")
+    with pytest.raises(ValueError):
+        parallel_map(abs, chunksize=0)
+
+
+def test_threaded_stages():
+    """Test threaded stages"""
+    res = pipeline(
+        generate(1, 100), threaded(map_of_square), threaded(filter_for_even, 3)
+    )
+    assert list(res) == [v**2 for v in range(2, 101, 2)]
+
+
+def test_threaded_thread():
+    """Test that threaded stage runs on another thread"""
+    names = set()
+
+    def record(stream):
+        for v in stream:
+            names.add(threading.current_thread().name)
+            yield v
+
+    assert list(pipeline(generate(1, 3), threaded(record))) == [1, 2, 3]
+    assert threading.current_thread().name not in names
+
+
+def test_threaded_backpressure():
+    """Test that threaded stage reads bounded number of elements ahead"""
+    number = {"count": 0}
+    num_threads = threading.active_count()
+
+    def count(stream):
+        for elem in stream:
+            number["count"] += 1
+            yield elem
+
+    res = pipeline(generate(1, 1000), count, threaded(increment_gen, 4))
+    assert next(res) == 2
+    time.sleep(0.1)
+    assert number["count"] <= 1 + 4 + 1
+    res.close()
+    assert threading.active_count() == num_threads
+
+
+def test_threaded_error():
+    """Test exceptions in threaded stage"""
+
+    def fail(stream):
+        for v in stream:
+            if v == 3:
+                raise ZeroDivisionError
+            yield v
+
+    res = pipeline(generate(1, 10), threaded(fail))
+    assert next(res) == 1
+    with pytest.raises(ZeroDivisionError):
+        list(res)
+    with pytest.raises(ValueError):
+        threaded(fail, 0)
+
+
+def test_generate_chunks():
+    """Test generate with chunks"""
+    assert list(generate(1, 7, 3)) == [range(1, 4), range(4, 7), range(7, 8)]
+    assert list(generate(1, 0, 3)) == []
+    with pytest.raises(ValueError):
+        list(generate(1, 7, 0))
+
+
+@pytest.mark.parametrize(
+    "operations, expected",
+    [
+        ((batch(3),), [[1, 2, 3], [4, 5, 6], [7]]),
+        (
+            (batch(3, "q"),),
+            [array("q", [1, 2, 3]), array("q", [4, 5, 6]), array("q", [7])],
+        ),
+        ((batch(2), unbatch()), [1, 2, 3, 4, 5, 6, 7]),
+        (
+            (batch(4), batch_map(lambda c: [v * 2 for v in c])),
+            [[2, 4, 6, 8], [10, 12, 14]],
+        ),
+        (
+            (batch(4, "q"), batch_filter(lambda c: [v % 2 for v in c])),
+            [array("q", [1, 3]), array("q", [5, 7])],
+        ),
+        (
+            (batch(3), batch_filter(lambda c: [v > 2 for v in c]), unbatch()),
+            [3, 4, 5, 6, 7],
+        ),
+    ],
+)
+def test_batch_operations(operations, expected):
+    """Test batch operations"""
+    assert list(pipeline(generate(1, 7), *operations)) == expected
+
+
+def test_chunked_generate_pipeline():
+    """Test pipeline over chunks produced by generate"""
+    res = pipeline(
+        generate(1, 10, 4),
+        batch_map(lambda c: [v**2 for v in c]),
+        batch_filter(lambda c: [v % 2 == 0 for v in c]),
+        unbatch(),
+    )
+    assert list(res) == [4, 16, 36, 64, 100]
+    with pytest.raises(ValueError):
+        batch(0)
+
+
+@pytest.mark.parametrize(
+    "operations, expected",
+    [
+        ((Map(lambda v: v * 2),), [2, 4, 6, 8]),
+        ((Map(lambda v: v * 2), Filter(lambda v: v > 4)), [6, 8]),
+        ((Filter(lambda v: v % 2), FlatMap(lambda v: [v, -v])), [1, -1, 3, -3]),
+        (
+            (FlatMap(range), Filter(bool), Map(str), FlatMap(lambda v: v * 2)),
+            ["1", "1", "1", "1", "2", "2", "1", "1", "2", "2", "3", "3"],
+        ),
+        (
+            (Map(lambda v: v + 1), increment_gen, Map(lambda v: v * 10)),
+            [30, 40, 50, 60],
+        ),
+    ],
+)
+def test_declarative_operations(val, operations, expected):
+    """Test declarative operations with fusion"""
+    res = pipeline(generate(val[0], val[-1]), *operations)
+    assert list(res) == expected
+    unfused = generate(val[0], val[-1])
+    for op in operations:
+        unfused = op(unfused)
+    assert list(unfused) == expected
+
+
+def test_fuse():
+    """Test that consecutive declarative operations are fused"""
+    ops = [Map(abs), Filter(bool), increment_gen, Map(str), FlatMap(list)]
+    fused = fuse(ops)
+    assert len(fused) == 3
+    assert fused[1] is increment_gen
+    assert isinstance(fuse([Map(abs)])[0], Map)
+
+
+def test_fused_lazy(val):
+    """Test lazy evaluation of fused operations"""
+    number = {"count": 0}
+
+    def count(v):
+        number["count"] += 1
+        return v
+
+    res = pipeline(generate(val[0], val[-1]), Map(count), Map(lambda v: v * 5))
+    assert number["count"] == 0
+    assert next(res) == 5
+    assert number["count"] == 1
+
+
+def test_profile():
+    """Test profiling of pipeline stages"""
+    reports = []
+
+    def slow(stream):
+        for v in stream:
+            time.sleep(0.001)
+            yield v
+
+    profile = PipelineProfile(callback=reports.append)
+    res = pipeline(
+        generate(1, 20),
+        Map(lambda v: v * 2),
+        Filter(lambda v: v % 4 == 0),
+        slow,
+        batch(5),
+        profile=profile,
+    )
+    assert list(res) == [[4, 8, 12, 16, 20], [24, 28, 32, 36, 40]]
+    assert reports == [profile]
+    names = [st.name for st in profile.stages]
+    assert names == ["source", "Map+Filter", "slow", "batch(5)"]
+    source, fused, slow_stats, batch_stats = profile.stages
+    assert (source.items_in, source.items_out) == (0, 20)
+    assert (fused.items_in, fused.items_out) == (20, 10)
+    assert (batch_stats.items_in, batch_stats.items_out) == (10, 2)
+    assert fused.peak_buffered == 2
+    assert batch_stats.peak_buffered == 5
+    assert slow_stats.wall_time >= 0.01
+    assert batch_stats.wall_time < slow_stats.wall_time
+    assert "Map+Filter" in profile.summary()
+
+
+def test_profile_threaded():
+    """Test profiling of a stage whose upstream runs on another thread"""
+
+    def slow(stream):
+        for v in stream:
+            time.sleep(0.001)
+            yield v
+
+    profile = PipelineProfile()
+    res = pipeline(
+        generate(1, 20),
+        slow,
+        threaded(Map(lambda v: v + 1)),
+        parallel_map(abs, executor="thread"),
+        profile=profile,
+    )
+    assert list(res) == list(range(2, 22))
+    names = [st.name for st in profile.stages]
+    assert names == ["source", "slow", "threaded(Map)", "parallel_map(abs)"]
+    _, slow_stats, threaded_stats, _ = profile.stages
+    assert threaded_stats.own_thread and not slow_stats.own_thread
+    assert slow_stats.wall_time >= 0.02
+    assert threaded_stats.wall_time >= 0
+    assert threaded_stats.cpu_time >= 0
+
+
+def test_profile_close():
+    """Test callback of profile on closed stream"""
+    reports = []
+    res = pipeline(generate(1, 100), profile=PipelineProfile(reports.append))
+    assert next(res) == 1
+    res.close()
+    assert len(reports) == 1
+    assert reports[0].stages[0].items_out == 1
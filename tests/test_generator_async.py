@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from project.generator import generate, pipeline, results
+from project.generator_async import (
+    agenerate,
+    amap,
+    async_pipeline,
+    async_results,
+    to_async,
+    to_sync,
+)
+from project.generator_collectors import Count, Mean
+
+
+async def square(v):
+    """Async function squares values"""
+    await asyncio.sleep(0)
+    return v**2
+
+
+async def filter_for_even(stream):
+    """Async operation generates even values"""
+    async for v in stream:
+        if v % 2 == 0:
+            yield v
+
+
+def test_agenerate():
+    """Test agenerate function"""
+    assert asyncio.run(async_results(agenerate(1, 4))) == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "operations, collector, expected",
+    [
+        ((amap(square),), list, [1, 4, 9, 16]),
+        ((filter_for_even,), list, [2, 4]),
+        ((amap(square, 3), filter_for_even), set, {4, 16}),
+        ((), sum, 10),
+    ],
+)
+def test_async_pipeline(operations, collector, expected):
+    """Tests the async_pipeline function"""
+    stream = async_pipeline(agenerate(1, 4), *operations)
+    assert asyncio.run(async_results(stream, collector)) == expected
+
+
+def test_async_results_collector():
+    """Test that collectors get elements as they arrive"""
+    counter = Count()
+
+    async def stream():
+        for i in range(5):
+            assert counter.count == i
+            yield i
+
+    assert asyncio.run(async_results(stream(), counter)) == 5
+    assert asyncio.run(async_results(agenerate(1, 4), Mean())) == 2.5
+
+
+def test_amap_concurrency():
+    """Test that amap limits number of running calls and keeps order"""
+    running = {"now": 0, "max": 0}
+
+    async def slow(v):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await asyncio.sleep(0.01 * (v % 3))
+        running["now"] -= 1
+        return v
+
+    stream = async_pipeline(agenerate(1, 20), amap(slow, 4))
+    assert asyncio.run(async_results(stream)) == list(range(1, 21))
+    assert running["max"] == 4
+
+
+def test_sync_adapters():
+    """Test adapters between sync and async streams"""
+    stream = async_pipeline(pipeline(generate(1, 4), lambda x: map(str, x)))
+    assert asyncio.run(async_results(stream)) == ["1", "2", "3", "4"]
+    assert results(to_sync(async_pipeline(to_async([1, 2]), amap(square)))) == [1, 4]
+    res = to_sync(agenerate(1, 1000))
+    assert next(res) == 1
+    res.close()
+
+
+def test_amap_errors():
+    """Test errors of amap"""
+
+    async def fail(v):
+        raise ZeroDivisionError
+
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(async_results(async_pipeline(agenerate(1, 3), amap(fail, 2))))
+    with pytest.raises(ValueError):
+        amap(square, 0)
@@ -0,0 +1,61 @@
+import pytest
+from project.generator import Filter, Map
+from project.generator_checkpoint import RangeSource, Scan, checkpointed
+
+
+def make_pipeline(path, interval=10):
+    """Running sum of squares of odd numbers from 1 to 100"""
+    return checkpointed(
+        RangeSource(1, 100),
+        Filter(lambda v: v % 2),
+        Map(lambda v: v * v),
+        Scan(lambda acc, v: acc + v, 0),
+        path=path,
+        interval=interval,
+    )
+
+
+def expected():
+    """Results of the pipeline without checkpoints"""
+    res, acc = [], 0
+    for v in range(1, 101, 2):
+        acc += v * v
+        res.append(acc)
+    return res
+
+
+def test_checkpointed_full(tmp_path):
+    """Test checkpointed pipeline without failures"""
+    path = tmp_path / "snapshot"
+    assert list(make_pipeline(path)) == expected()
+    assert list(make_pipeline(path)) == []
+
+
+def test_checkpointed_resume(tmp_path):
+    """Test resume after a failure of consumer"""
+    path = tmp_path / "snapshot"
+    got = []
+    with pytest.raises(RuntimeError):
+        for elem in make_pipeline(path, interval=7):
+            if len(got) == 23:
+                raise RuntimeError("crash")
+            got.append(elem)
+    resumed = list(make_pipeline(path, interval=7))
+    assert got[:21] + resumed == expected()
+
+
+def test_checkpointed_interval(tmp_path):
+    """Test wrong interval"""
+    with pytest.raises(ValueError):
+        list(make_pipeline(tmp_path / "snapshot", interval=0))
+
+
+def test_range_source():
+    """Test RangeSource state"""
+    source = RangeSource(1, 5)
+    it = iter(source)
+    assert next(it) == 1
+    assert source.state() == 2
+    other = RangeSource(1, 5)
+    other.restore(source.state())
+    assert list(other) == [2, 3, 4, 5]
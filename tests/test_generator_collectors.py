@@ -0,0 +1,102 @@
+import random
+import statistics
+
+import pytest
+from project.generator import generate, pipeline, results, Map
+from project.generator_collectors import (
+    Count,
+    Sum,
+    Min,
+    Max,
+    Mean,
+    Variance,
+    TopK,
+    HyperLogLog,
+    Quantile,
+    Histogram,
+    Combine,
+    Collector,
+    RemovableCollector,
+)
+
+
+@pytest.mark.parametrize(
+    "collector, expected",
+    [
+        (Count(), 10),
+        (Sum(), 55),
+        (Min(), 1),
+        (Max(), 10),
+        (Mean(), 5.5),
+        (Variance(), 8.25),
+        (Variance(ddof=1), statistics.variance(range(1, 11))),
+        (TopK(3), [10, 9, 8]),
+        (TopK(2, key=lambda v: -v), [1, 2]),
+        (Histogram([0, 3, 6, 10]), [2, 3, 5]),
+    ],
+)
+def test_collectors(collector, expected):
+    """Test streaming collectors with results"""
+    assert results(generate(1, 10), collector) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "collector, expected",
+    [
+        (Count(), 0),
+        (Min(), None),
+        (Mean(), None),
+        (Variance(ddof=1), None),
+        (Quantile(), None),
+        (TopK(2), []),
+    ],
+)
+def test_collectors_empty(collector, expected):
+    """Test collectors on an empty stream"""
+    assert results(generate(1, 0), collector) == expected
+
+
+def test_hyperloglog():
+    """Test approximate distinct count"""
+    values = [i % 20000 for i in range(50000)]
+    assert results(iter(values), HyperLogLog(12)) == pytest.approx(20000, rel=0.05)
+    assert results(iter("abcabc"), HyperLogLog()) == 3
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+
+
+@pytest.mark.parametrize("q", [0.1, 0.5, 0.9])
+def test_quantile(q):
+    """Test approximate quantile"""
+    rnd = random.Random(1)
+    values = [rnd.random() for _ in range(20000)]
+    assert results(iter(values), Quantile(q)) == pytest.approx(q, abs=0.02)
+    assert results(iter([5, 1, 3]), Quantile(0.5)) == 3
+
+
+def test_histogram_bounds():
+    """Test histogram underflow and overflow"""
+    h = Histogram([0, 1, 2])
+    results(iter([-1, 0, 0.5, 1, 2, 3]), h)
+    assert h.counts == [2, 2]
+    assert (h.underflow, h.overflow) == (1, 1)
+
+
+def test_combine():
+    """Test several collectors in a single pass"""
+    stream = pipeline(generate(1, 100), Map(lambda v: v % 10))
+    res = results(stream, Combine(n=Count(), top=TopK(2), mean=Mean(), hi=Max()))
+    assert res == {"n": 100, "top": [9, 9], "mean": pytest.approx(4.5), "hi": 9}
+
+
+def test_collector_is_abstract():
+    """Test that collectors must implement add and result"""
+
+    class Partial(Collector):
+        def add(self, elem):
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()
+    assert isinstance(Sum(), RemovableCollector)
+    assert not isinstance(Max(), RemovableCollector)
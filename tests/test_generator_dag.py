@@ -0,0 +1,74 @@
+import pytest
+from project.generator import generate, Map, Filter, batch
+from project.generator_collectors import Count, Sum, Max
+from project.generator_dag import Dag
+
+
+def test_dag_sinks():
+    """Test several sinks with shared upstream stages"""
+    calls = {"count": 0}
+
+    def source():
+        for v in generate(1, 1000):
+            calls["count"] += 1
+            yield v
+
+    dag = Dag(source(), buffer=4)
+    squares = dag.stage(dag.root, Map(lambda v: v * v))
+    evens = dag.stage(squares, Filter(lambda v: v % 2 == 0))
+    dag.sink("total", squares, Sum())
+    dag.sink("evens", evens, Count())
+    dag.sink("first", evens, lambda s: next(iter(s)))
+    dag.sink("raw", dag.root, Max())
+    dag.sink("batches", dag.stage(dag.root, batch(300)), list)
+    res = dag.run()
+    assert calls["count"] == 1000
+    assert res["total"] == sum(v * v for v in range(1, 1001))
+    assert res["evens"] == 500
+    assert res["first"] == 4
+    assert res["raw"] == 1000
+    assert [len(b) for b in res["batches"]] == [300, 300, 300, 100]
+
+
+def test_dag_single_sink():
+    """Test DAG which is a linear pipeline"""
+    dag = Dag([1, 2, 3])
+    dag.sink("list", dag.stage(dag.root, Map(str)))
+    assert dag.run() == {"list": ["1", "2", "3"]}
+
+
+def test_dag_collector_args():
+    """Test collector arguments of sink"""
+    dag = Dag(generate(1, 4))
+    dag.sink("sorted", dag.root, sorted, reverse=True)
+    dag.sink("sum", dag.root, sum)
+    dag.sink("sum10", dag.root, sum, 10)
+    assert dag.run() == {"sorted": [4, 3, 2, 1], "sum": 10, "sum10": 20}
+
+
+def test_dag_error():
+    """Test error in one branch"""
+
+    def fail(v):
+        if v == 50:
+            raise ZeroDivisionError
+        return v
+
+    dag = Dag(generate(1, 10_000), buffer=2)
+    dag.sink("ok", dag.root, Count())
+    dag.sink("bad", dag.stage(dag.root, Map(fail)), Count())
+    with pytest.raises(ZeroDivisionError):
+        dag.run()
+    with pytest.raises(ValueError):
+        dag.sink("ok", dag.root)
+    with pytest.raises(ValueError):
+        Dag([], buffer=0)
+
+
+def test_dag_stage_without_sink():
+    """Test that stages which don't lead to a sink are not run"""
+    dag = Dag(range(100), buffer=2)
+    dead = dag.stage(dag.root, Map(str))
+    dag.stage(dead, Map(len))
+    dag.sink("total", dag.root, sum)
+    assert dag.run() == {"total": 4950}
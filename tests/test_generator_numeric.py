@@ -0,0 +1,105 @@
+from array import array
+import math
+
+import pytest
+from project.generator import generate, pipeline, results, Map, Filter
+from project.generator_collectors import Min, Max, Mean, Combine
+from project.generator_numeric import (
+    arange,
+    vmap,
+    vfilter,
+    to_elements,
+    ChunkCount,
+    ChunkSum,
+    ChunkMin,
+    ChunkMax,
+    ChunkMean,
+    np,
+)
+
+
+def backends():
+    """Available backends"""
+    return ["array"] if np is None else ["array", "numpy"]
+
+
+@pytest.mark.parametrize("backend", backends())
+def test_arange(backend):
+    """Test chunks of range"""
+    chunks = list(arange(1, 10, chunksize=4, backend=backend))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert results(pipeline(iter(chunks), to_elements())) == list(range(1, 11))
+    assert list(arange(5, 4, backend=backend)) == []
+    if backend == "array":
+        assert all(isinstance(c, array) and c.typecode == "q" for c in chunks)
+
+
+def test_arange_errors():
+    """Test invalid arguments of arange"""
+    with pytest.raises(ValueError):
+        list(arange(1, 10, chunksize=0))
+    with pytest.raises(ValueError):
+        list(arange(1, 10, backend="list"))
+
+
+@pytest.mark.parametrize("backend", backends())
+def test_numeric_pipeline_matches_elements(backend):
+    """Test that chunk stages give the same results as per-element stages"""
+    square = lambda v: v * v
+    odd = lambda v: v % 2 == 1
+
+    expected = results(pipeline(generate(1, 10_000), Filter(odd), Map(square)))
+    chunks = pipeline(
+        arange(1, 10_000, chunksize=999, backend=backend), vfilter(odd), vmap(square)
+    )
+    stats = results(
+        chunks,
+        Combine(
+            count=ChunkCount(),
+            sum=ChunkSum(),
+            min=ChunkMin(),
+            max=ChunkMax(),
+            mean=ChunkMean(),
+        ),
+    )
+    assert stats["count"] == len(expected)
+    assert stats["sum"] == sum(expected)
+    assert stats["min"] == Min()(expected)
+    assert stats["max"] == Max()(expected)
+    assert math.isclose(stats["mean"], Mean()(expected))
+
+    elements = pipeline(
+        arange(1, 10_000, chunksize=999, backend=backend),
+        vfilter(odd),
+        vmap(square),
+        to_elements(),
+    )
+    assert results(elements) == expected
+
+
+def test_vmap_typecode():
+    """Test typecode of results of array chunks"""
+    (chunk,) = pipeline(
+        arange(1, 4, backend="array"), vmap(lambda v: v / 2, typecode="d")
+    )
+    assert chunk.typecode == "d" and list(chunk) == [0.5, 1.0, 1.5, 2.0]
+    (chunk,) = pipeline(iter([range(3)]), vmap(lambda v: v + 1))
+    assert chunk == [1, 2, 3]
+
+
+def test_chunk_reductions_empty():
+    """Test reductions of empty streams and chunks"""
+    chunks = [array("q"), array("q")]
+    assert ChunkMin()(chunks) is None
+    assert ChunkMax()(chunks) is None
+    assert ChunkMean()(chunks) is None
+    assert ChunkSum()(chunks) == 0
+    assert ChunkCount()(chunks) == 0
+
+
+@pytest.mark.skipif(np is None, reason="NumPy is not installed")
+def test_chunk_sum_numpy_exact():
+    """Test that sums of large integers don't overflow"""
+    chunk = np.full(1000, 2**62, dtype="q")
+    assert ChunkSum()([chunk, -chunk[:10]]) == 990 * 2**62
+    assert ChunkSum()([np.array([0.5, 0.25])]) == 0.75
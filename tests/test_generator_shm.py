@@ -0,0 +1,95 @@
+import os
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+from project.generator import generate, pipeline, batch, unbatch
+from project import generator_shm
+from project.generator_shm import RingAllocator, shm_map
+
+
+def double(chunk):
+    """Function doubles numbers of chunk"""
+    return array(chunk.format, [v * 2 for v in chunk])
+
+
+def same(chunk):
+    """Function returns chunk as it is"""
+    return chunk
+
+
+def fail(chunk):
+    """Function always fails"""
+    raise ZeroDivisionError
+
+
+def die(chunk):
+    """Function kills the worker process"""
+    os._exit(1)
+
+
+def test_ring_allocator():
+    """Test ring allocator"""
+    ring = RingAllocator(10)
+    assert ring.alloc(4) == 0
+    assert ring.alloc(4) == 4
+    assert ring.alloc(4) is None
+    ring.release()
+    assert ring.alloc(4) == 0
+    assert ring.alloc(1) is None
+    ring.release()
+    assert ring.alloc(3) == 4
+    with pytest.raises(ValueError):
+        ring.alloc(11)
+
+
+@pytest.mark.parametrize("capacity", [64, 1 << 16])
+def test_shm_map(capacity):
+    """Test shm_map with small and large ring buffers"""
+    res = pipeline(
+        generate(1, 100), batch(7, "d"), shm_map(double, capacity), unbatch()
+    )
+    assert list(res) == [v * 2.0 for v in range(1, 101)]
+
+
+def test_shm_map_same():
+    """Test that worker may return a view of shared memory"""
+    chunks = [array("q", range(i, i + 5)) for i in range(0, 50, 5)]
+    res = list(pipeline(chunks, shm_map(same, 128, 2)))
+    assert res == chunks
+    assert all(c.typecode == "q" for c in res)
+
+
+def test_shm_map_errors():
+    """Test errors of shm_map"""
+    with pytest.raises(ZeroDivisionError):
+        list(pipeline([array("d", [1.0])], shm_map(fail)))
+    with pytest.raises(ValueError):
+        list(pipeline([array("d", range(100))], shm_map(same, 64)))
+    with pytest.raises(ValueError):
+        shm_map(same, 0)
+
+
+def test_shm_map_close():
+    """Test early close of shm_map"""
+    res = pipeline(generate(1, 1000), batch(10, "q"), shm_map(same, 256))
+    assert list(next(res)) == list(range(1, 11))
+    res.close()
+
+
+def test_shm_map_worker_dies(monkeypatch):
+    """Test that shared memory is unlinked when the worker process dies"""
+    names = []
+
+    class Recorded(SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            names.append(self.name)
+
+    monkeypatch.setattr(generator_shm, "SharedMemory", Recorded)
+    with pytest.raises(EOFError):
+        list(pipeline([array("d", [1.0])], shm_map(die)))
+    assert len(names) == 2
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name)
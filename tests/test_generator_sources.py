@@ -0,0 +1,78 @@
+import struct
+from array import array
+
+import pytest
+from project.generator import pipeline, results, Map, Filter, batch_map, unbatch
+from project.generator_sources import read_lines, read_records, read_numbers
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    """Provides a text file with lines"""
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"first\nsecond\r\n\nlast")
+    return path
+
+
+@pytest.fixture
+def numbers_file(tmp_path):
+    """Provides a binary file with 10 doubles"""
+    path = tmp_path / "numbers.bin"
+    path.write_bytes(array("d", range(10)).tobytes())
+    return path
+
+
+def test_read_lines(text_file):
+    """Test read_lines function"""
+    assert list(read_lines(text_file)) == ["first", "second", "", "last"]
+    assert list(read_lines(text_file, keepends=True)) == [
+        "first\n",
+        "second\r\n",
+        "\n",
+        "last",
+    ]
+    res = pipeline(read_lines(text_file), Filter(bool), Map(len))
+    assert results(res, sum) == 5 + 6 + 4
+
+
+def test_read_empty(tmp_path):
+    """Test sources over an empty file"""
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    assert list(read_lines(path)) == []
+    assert list(read_records(path, "<i")) == []
+    assert list(read_numbers(path)) == []
+
+
+def test_read_records(tmp_path):
+    """Test read_records function"""
+    path = tmp_path / "records.bin"
+    path.write_bytes(b"".join(struct.pack("<iH", i, i * 2) for i in range(5)))
+    assert list(read_records(path, "<iH")) == [(i, i * 2) for i in range(5)]
+    with pytest.raises(ValueError):
+        list(read_records(path, "<q"))
+
+
+@pytest.mark.parametrize("copy", [False, True])
+def test_read_numbers(numbers_file, copy):
+    """Test read_numbers function"""
+    chunks = list(read_numbers(numbers_file, "d", 4, copy=copy))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert all(isinstance(c, array if copy else memoryview) for c in chunks)
+    assert [list(c) for c in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_read_numbers_pipeline(numbers_file):
+    """Test read_numbers in pipeline"""
+    res = pipeline(
+        read_numbers(numbers_file, chunksize=3),
+        batch_map(lambda c: [v * 2 for v in c]),
+        unbatch(),
+    )
+    assert results(res, sum) == 90.0
+    with pytest.raises(ValueError):
+        list(read_numbers(numbers_file, "q", 0))
+    path = numbers_file.parent / "odd.bin"
+    path.write_bytes(b"abc")
+    with pytest.raises(ValueError):
+        list(read_numbers(path, "h"))
@@ -0,0 +1,101 @@
+import os
+import tracemalloc
+
+import pytest
+from project.generator import generate, pipeline, results
+from project.generator_collectors import Count, Sum, Mean, Max, Variance
+from project.generator_windows import (
+    SlidingMin,
+    SlidingMax,
+    tumbling,
+    sliding,
+    session,
+    group_by_window,
+)
+
+
+@pytest.mark.parametrize(
+    "operation, expected",
+    [
+        (tumbling(3, Sum), [6, 15, 24, 10]),
+        (tumbling(4, Max), [4, 8, 10]),
+        (sliding(3, Sum), [6, 9, 12, 15, 18, 21, 24, 27]),
+        (sliding(3, Sum, step=3), [6, 15, 24]),
+        (sliding(4, Mean, step=2), [2.5, 4.5, 6.5, 8.5]),
+        (sliding(3, SlidingMax), [3, 4, 5, 6, 7, 8, 9, 10]),
+        (sliding(20, Count), []),
+    ],
+)
+def test_windows(operation, expected):
+    """Test tumbling and sliding windows"""
+    assert list(pipeline(generate(1, 10), operation)) == pytest.approx(expected)
+
+
+def test_sliding_matches_recomputation():
+    """Test that incremental sliding aggregates match recomputed ones"""
+    values = [5, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9, 3]
+    for agg, func in [
+        (SlidingMin, min),
+        (SlidingMax, max),
+        (Variance, lambda w: sum((v - sum(w) / len(w)) ** 2 for v in w) / len(w)),
+    ]:
+        expected = [func(values[i : i + 4]) for i in range(len(values) - 3)]
+        assert list(pipeline(values, sliding(4, agg))) == pytest.approx(expected)
+
+
+def test_sliding_not_removable():
+    """Test sliding window with collector without remove"""
+    with pytest.raises(TypeError) as excinfo:
+        sliding(2, Max)
+    assert str(excinfo.value) == "Max can't remove elements"
+
+
+def test_session():
+    """Test session windows"""
+    times = [1, 2, 3, 10, 11, 30, 31, 32, 33]
+    assert list(pipeline(times, session(5, Count))) == [3, 2, 4]
+    events = [(t, "e") for t in times]
+    res = pipeline(events, session(1, Count, key=lambda e: e[0]))
+    assert list(res) == [3, 2, 4]
+    assert list(pipeline([], session(1, Count))) == []
+
+
+def test_group_by_window():
+    """Test keyed windows"""
+    res = pipeline(generate(1, 10), group_by_window(lambda v: v % 2, 2, Sum))
+    assert list(res) == [(1, 4), (0, 6), (1, 12), (0, 14), (1, 9), (0, 10)]
+    res = pipeline(generate(1, 6), group_by_window(lambda v: v % 3, 5, Count, 2))
+    assert list(res) == [(1, 1), (2, 1), (0, 1), (1, 1), (2, 1), (0, 1)]
+
+
+def peak_memory(n):
+    """Peak memory of windowed pipelines over n generated elements"""
+    tracemalloc.start()
+    results(pipeline(generate(1, n), sliding(100, Mean), tumbling(1000, Max)), Count())
+    results(
+        pipeline(generate(1, n), group_by_window(lambda v: v % 7, 50, Sum)), Count()
+    )
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def test_windows_memory():
+    """Test that memory of windows does not depend on stream length"""
+    small = peak_memory(10_000)
+    assert peak_memory(200_000) < small * 1.5 + 10_000
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_SLOW_TESTS"), reason="set RUN_SLOW_TESTS=1 to run"
+)
+def test_windows_memory_huge():
+    """Test memory bound of windows on a 100M-element stream"""
+    resource = pytest.importorskip("resource")
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    res = pipeline(
+        generate(1, 100_000_000), sliding(1000, Mean), tumbling(10**6, Max)
+    )
+    assert results(res, Count()) == 100
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    assert after - before < 50 * 1024
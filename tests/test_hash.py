@@ -1,5 +1,10 @@
+import io
+import pickle
+
 import pytest
+from project import hashtable
 from project.hashtable import HashTable
+from project.hashtable_bloom import CountingBloomFilter
 
 
 def test_set_get_len():
@@ -82,3 +87,146 @@ def test_collision():
     for k, v in zip(keys, vals):
         del t[k]
         assert k not in t
+
+
+def test_bloom_filter():
+    """Test counting Bloom filter"""
+    f = CountingBloomFilter(64)
+    assert hash("k") not in f
+    f.add(hash("k"))
+    f.add(hash("k"))
+    assert hash("k") in f
+    f.remove(hash("k"))
+    assert hash("k") in f
+    f.remove(hash("k"))
+    assert hash("k") not in f
+
+
+def test_bloom_table():
+    """Test hash table with Bloom filter"""
+    t = HashTable(num_slots=2, bloom=True)
+    for i in range(100):
+        t[i] = i
+    assert t.num_slots > 2
+    for i in range(100):
+        assert t[i] == i
+        assert i in t
+    assert sum(i in t for i in range(100, 1100)) < 100
+    for i in range(0, 100, 2):
+        del t[i]
+    for i in range(100):
+        assert (i in t) == (i % 2 == 1)
+    with pytest.raises(KeyError):
+        t[0]
+    t.clear()
+    assert 1 not in t
+    assert not any(t.bloom.counters)
+
+
+@pytest.mark.parametrize("bloom", [False, True])
+def test_dump_load(bloom):
+    """Test dump and load methods"""
+    t = HashTable(bloom=bloom)
+    for i in range(100):
+        t[f"k{i}"] = i
+    buffer = io.BytesIO()
+    t.dump(buffer, slots_per_record=7)
+    buffer.seek(0)
+    loaded = HashTable.load(buffer)
+    assert len(loaded) == 100
+    assert loaded.num_slots == t.num_slots
+    assert loaded.hash_table == t.hash_table
+    assert dict(loaded.items()) == dict(t.items())
+    assert "k5" in loaded
+    assert "k100" not in loaded
+    assert (loaded.bloom is not None) == bloom
+
+
+def test_load_other_hash(monkeypatch):
+    """Test load of dump written with another hash function"""
+    t = HashTable()
+    for i in range(20):
+        t[(i, "k")] = i
+    buffer = io.BytesIO()
+    t.dump(buffer)
+    buffer.seek(0)
+    monkeypatch.setattr(hashtable, "_fingerprint", lambda: 0)
+    loaded = HashTable.load(buffer)
+    assert len(loaded) == 20
+    assert all(loaded[(i, "k")] == i for i in range(20))
+
+
+def test_load_wrong_file():
+    """Test load of wrong and truncated files"""
+    with pytest.raises(ValueError):
+        HashTable.load(io.BytesIO(b"not a hash table dump" * 2))
+    buffer = io.BytesIO()
+    HashTable().dump(buffer)
+    with pytest.raises(ValueError):
+        HashTable.load(io.BytesIO(buffer.getvalue()[:-1]))
+
+
+def test_pickle():
+    """Test pickling of hash table"""
+    t = HashTable(bloom=True)
+    t["a"] = [1, 2]
+    t["b"] = None
+    loaded = pickle.loads(pickle.dumps(t))
+    assert dict(loaded.items()) == {"a": [1, 2], "b": None}
+    assert "c" not in loaded
+
+
+class Colliding:
+    """Key with constant hash"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return 0
+
+    def __eq__(self, other):
+        return isinstance(other, Colliding) and self.value == other.value
+
+
+def test_dump_long_slots():
+    """Test dump of slots longer than 255 items"""
+    t = HashTable()
+    for i in range(300):
+        t[Colliding(i)] = i
+    buffer = io.BytesIO()
+    t.dump(buffer)
+    buffer.seek(0)
+    loaded = HashTable.load(buffer)
+    assert len(loaded) == 300
+    assert [len(slot) for slot in loaded.hash_table] == [
+        len(slot) for slot in t.hash_table
+    ]
+    assert loaded[Colliding(299)] == 299
+
+
+class Key:
+    """Key hashed by identity"""
+
+
+@pytest.mark.parametrize("bloom", [False, True])
+def test_pickle_identity_keys(bloom):
+    """Test that keys hashed by identity are rehashed on load"""
+    t = HashTable(bloom=bloom)
+    for i in range(20):
+        t[Key()] = i
+    t[(1, "a")] = 20
+    loaded = pickle.loads(pickle.dumps(t))
+    assert len(loaded) == 21
+    assert sorted(loaded[k] for k in loaded) == list(range(21))
+    assert loaded[(1, "a")] == 20
+
+
+def test_dump_is_compact():
+    """Test that dump is smaller than pickled slot lists"""
+    t = HashTable()
+    for i in range(10000):
+        t[i] = i
+    buffer = io.BytesIO()
+    t.dump(buffer)
+    assert len(buffer.getvalue()) < len(pickle.dumps(t.hash_table)) * 0.8
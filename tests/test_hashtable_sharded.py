@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+from project.hashtable_sharded import ShardedHashTable
+
+
+@pytest.fixture
+def table():
+    """Provides sharded hash table with three shards"""
+    t = ShardedHashTable(num_shards=3)
+    yield t
+    t.close()
+
+
+def test_set_get_len(table):
+    """Test set, get, len methods"""
+    assert len(table) == 0
+    table["k1"] = 1
+    assert table["k1"] == 1
+    table["k1"] = 3
+    assert table["k1"] == 3
+    assert len(table) == 1
+    with pytest.raises(KeyError):
+        assert table["k2"]
+
+
+def test_many(table):
+    """Test batched methods"""
+    table.set_many((i, i * i) for i in range(100))
+    assert len(table) == 100
+    assert table.get_many([5, 200, 7], default=-1) == [25, -1, 49]
+    assert table.delete_many([1, 2, 300]) == [300]
+    assert 1 not in table
+    assert 3 in table
+    assert sorted(table) == [0] + list(range(3, 100))
+
+
+def test_delete_clear(table):
+    """Test delition of items and clear method"""
+    table["k"] = 1
+    del table["k"]
+    with pytest.raises(KeyError):
+        del table["k"]
+    table.set_many([("a", 1), ("b", 2)])
+    table.clear()
+    assert len(table) == 0
+
+
+def test_unhashable_key(table):
+    """Test unhashable key"""
+    with pytest.raises(TypeError):
+        table.set_many([([1], 1)])
+
+
+def test_unpicklable_value(table):
+    """Test that a failed batch doesn't leave unread replies"""
+    keys = list(range(10))
+    with pytest.raises(TypeError):
+        table.set_many([(k, threading.Lock() if k == 2 else k) for k in keys])
+    table[0] = 100
+    assert table[0] == 100
+    assert len(table) == 1
+
+
+def test_num_shards():
+    """Test wrong number of shards"""
+    with pytest.raises(ValueError):
+        ShardedHashTable(num_shards=0)
@@ -1,5 +1,8 @@
 import pytest
+import asyncio
 import random
+import threading
+import time
 from copy import deepcopy
 
 from project.smart_args import smart_args, Evaluated, Isolated
@@ -138,3 +141,139 @@ def test_evaluated_callable():
     with pytest.raises(TypeError) as excinfo:
         Evaluated(5)
     assert str(excinfo.value) == "Must be initialized with a callable function."
+
+
+def test_plain_arguments_pass_through():
+    """Test that arguments without Isolated and Evaluated defaults are not copied"""
+
+    @smart_args
+    def func(*, a, b=[], c=Isolated()):
+        return a, b, c
+
+    a, b, c = [1], [2], [3]
+    res = func(a=a, b=b, c=c, unknown=0)
+    assert res[0] is a and res[1] is b
+    assert res[2] == c and res[2] is not c
+    assert func(a=a, c=c)[1] == []
+
+
+def test_first_missing_argument():
+    """Test that the first missing argument is reported"""
+
+    @smart_args
+    def func(*, x=Isolated(), y, z=Evaluated(lambda: 0)):
+        return x, y, z
+
+    with pytest.raises(TypeError) as excinfo:
+        func(y=1)
+    assert str(excinfo.value) == "Error: argument x must be Isolated"
+    with pytest.raises(TypeError) as excinfo:
+        func(x=1)
+    assert str(excinfo.value) == "Error: argument y is not provided"
+    assert func(x=1, y=2) == (1, 2, 0)
+
+
+def test_evaluated_ttl():
+    """Test that Evaluated value is reused while it is not expired"""
+    calls = []
+
+    def get_val():
+        calls.append(1)
+        return len(calls)
+
+    @smart_args
+    def func(*, x=Evaluated(get_val, ttl=60), y=Evaluated(get_val, ttl=0)):
+        return x, y
+
+    assert func() == (1, 2)
+    assert func() == (1, 3)
+    assert func(x=0) == (0, 4)
+
+
+def test_evaluated_concurrent():
+    """Test that concurrent Evaluated defaults are evaluated at the same time"""
+
+    def slow():
+        time.sleep(0.2)
+        return threading.current_thread().name
+
+    @smart_args
+    def func(*, a=Evaluated(slow, concurrent=True), b=Evaluated(slow, concurrent=True)):
+        return a, b
+
+    start = time.monotonic()
+    a, b = func()
+    assert time.monotonic() - start < 0.35
+    assert a != b
+    assert func(a="x")[0] == "x"
+
+
+def test_evaluated_async():
+    """Test coroutine defaults of async functions"""
+
+    async def slow():
+        await asyncio.sleep(0.2)
+        return 1
+
+    @smart_args
+    async def func(*, a=Evaluated(slow), b=Evaluated(slow), c=Evaluated(lambda: 2)):
+        return a + b + c
+
+    start = time.monotonic()
+    assert asyncio.run(func()) == 4
+    assert time.monotonic() - start < 0.35
+    assert asyncio.run(func(a=10)) == 13
+
+    with pytest.raises(TypeError) as excinfo:
+
+        @smart_args
+        def sync(*, a=Evaluated(slow)):
+            return a
+
+    assert str(excinfo.value) == (
+        "Error: argument a has async default in not async function"
+    )
+
+
+def test_errors_in_parameter_order():
+    """Test that the error of the first wrong parameter is raised"""
+
+    @smart_args
+    def func(*, a=Isolated(), b, c=Evaluated(lambda: 0)):
+        return a, b, c
+
+    with pytest.raises(AssertionError) as excinfo:
+        func(a=Evaluated(lambda: 1))
+    assert str(excinfo.value) == "Error: argument a gets Evaluated object directly"
+    with pytest.raises(TypeError) as excinfo:
+        func(a=1, c=Isolated())
+    assert str(excinfo.value) == "Error: argument b is not provided"
+
+    @smart_args
+    def other(*, a=Evaluated(lambda: 0), b=Isolated()):
+        return a, b
+
+    with pytest.raises(AssertionError) as excinfo:
+        other(a=Isolated(), b=Evaluated(lambda: 1))
+    assert str(excinfo.value) == "Error: argument a gets Isolated object directly"
+
+
+def test_evaluated_async_ttl_single_call():
+    """Test that concurrent calls share one evaluation of a cached coroutine default"""
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    @smart_args
+    async def func(*, x=Evaluated(slow, ttl=60)):
+        return x
+
+    async def main():
+        return await asyncio.gather(*(func() for _ in range(5)))
+
+    assert asyncio.run(main()) == [1] * 5
+    assert asyncio.run(func()) == 1
+    assert calls == [1]
@@ -0,0 +1,112 @@
+import pytest
+from copy import deepcopy
+
+from project.smart_args import smart_args, Isolated
+from project.smart_args_copy import fast_copy, register_copier, COPIERS
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return (self.x, self.y) == (other.x, other.y)
+
+
+def test_fast_copy_json_like():
+    """Test that fast copy equals deepcopy and shares no containers"""
+
+    value = {"a": [1, 2.5, "s", None, True], "b": ({"c": [b"x"]},), "d": {1, 2}}
+    copy = fast_copy(value)
+    assert copy == deepcopy(value)
+    assert copy is not value
+    assert copy["a"] is not value["a"]
+    assert copy["b"][0]["c"] is not value["b"][0]["c"]
+    assert copy["d"] is not value["d"]
+
+
+def test_fast_copy_other_types_use_deepcopy():
+    """Test values of not registered types"""
+
+    value = [Point(1, [2])]
+    copy = fast_copy(value)
+    assert copy == value
+    assert copy[0] is not value[0] and copy[0].y is not value[0].y
+
+
+def test_fast_copy_frozenset_members():
+    """Test that mutable members of frozensets are not shared"""
+
+    class Tag:
+        def __init__(self):
+            self.names = []
+
+    value = {"tags": frozenset({Tag()}), "ids": frozenset({1, "a"})}
+    copy = fast_copy(value)
+    assert copy["ids"] == value["ids"]
+    (tag,) = value["tags"]
+    (copied,) = copy["tags"]
+    assert copied is not tag and copied.names is not tag.names
+
+
+def test_fast_copy_cycles():
+    """Test that cyclic structures fall back to deepcopy"""
+
+    value = [1]
+    value.append(value)
+    copy = fast_copy(value)
+    assert copy[1] is copy
+    assert copy is not value
+
+
+def test_fast_copy_deep():
+    """Test deep but acyclic structures"""
+
+    value = current = []
+    for _ in range(100):
+        current.append([])
+        current = current[0]
+    assert fast_copy(value) == value
+
+
+def test_fast_copy_shared():
+    """Test that shared containers stay shared as with deepcopy"""
+
+    x = [0]
+    for _ in range(40):
+        x = [x, x]
+    copy = fast_copy(x)
+    assert copy[0] is copy[1]
+    assert copy[0] is not x[0]
+
+    inner = {"a": 1}
+    copy = fast_copy({"x": inner, "y": (inner,)})
+    assert copy["x"] is copy["y"][0]
+
+
+def test_register_copier():
+    """Test type-specialized copier"""
+
+    register_copier(Point, lambda p, copy: Point(p.x, copy(p.y)))
+    try:
+        value = {"p": Point(1, [2])}
+        copy = fast_copy(value)
+        assert copy == value and copy["p"].y is not value["p"].y
+    finally:
+        del COPIERS[Point]
+
+
+def test_smart_args_copier():
+    """Test Isolated argument with a copier"""
+
+    @smart_args
+    def func(*, d=Isolated(copier=fast_copy)):
+        d["a"].append(2)
+        return d
+
+    orig = {"a": [1]}
+    assert func(d=orig) == {"a": [1, 2]}
+    assert orig == {"a": [1]}
+    with pytest.raises(ValueError):
+        Isolated(copy_on_write=True, copier=fast_copy)
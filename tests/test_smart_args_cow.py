@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import pytest
+from copy import deepcopy
+
+from project.smart_args import smart_args, Isolated
+from project.smart_args_cow import cow, materialize, CowDict, CowList
+
+
+def test_cow_reads():
+    """Test that proxies read like the source"""
+
+    source = {"a": [1, 2, {"b": 3}], "c": "text", "d": None}
+    proxy = cow(source)
+    assert isinstance(proxy, CowDict)
+    assert isinstance(proxy["a"], CowList)
+    assert proxy == source
+    assert proxy["a"][2]["b"] == 3
+    assert proxy["a"][-1] == {"b": 3}
+    assert proxy["a"][1:] == [2, {"b": 3}]
+    assert len(proxy) == 3 and "c" in proxy
+    assert proxy["a"] is proxy["a"]
+
+
+def test_cow_writes_do_not_change_source():
+    """Test that writes to proxies are isolated as with deepcopy"""
+
+    source = {"a": [1, {"b": 2}], "c": {"d": [3]}, "s": {4}}
+    expected = deepcopy(source)
+    proxy = cow(source)
+    copy = deepcopy(source)
+    for obj in (proxy, copy):
+        obj["a"][1]["b"] = 20
+        obj["a"].append(5)
+        obj["a"].insert(0, 0)
+        obj["c"]["d"].pop()
+        del obj["c"]["d"]
+        obj["s"].add(6)
+        obj["new"] = []
+    assert source == expected
+    assert proxy == copy
+
+
+def test_cow_keeps_assigned_values():
+    """Test that values assigned by the callee are returned as they are"""
+
+    value = [1]
+    proxy = cow([[0], [2]])
+    proxy[0] = value
+    assert proxy[0] is value
+    value.append(2)
+    assert proxy == [[1, 2], [2]]
+
+
+def test_cow_index_error():
+    """Test missing keys and indexes"""
+
+    proxy = cow({"a": [1]})
+    with pytest.raises(KeyError):
+        proxy["b"]
+    with pytest.raises(IndexError):
+        proxy["a"][1]
+    with pytest.raises(IndexError):
+        cow([10, 20, 30])[-5]
+    assert cow([10, 20, 30])[-3] == 10
+
+
+def test_smart_args_copy_on_write():
+    """Test Isolated argument with copy on write"""
+
+    @smart_args
+    def func(*, d=Isolated(copy_on_write=True)):
+        d["a"]["b"] = 0
+        return d
+
+    orig = {"a": {"b": 10}, "c": [1]}
+    res = func(d=orig)
+    assert res == {"a": {"b": 0}, "c": [1]}
+    assert orig == {"a": {"b": 10}, "c": [1]}
+
+
+def test_smart_args_copy_on_write_result_is_isolated():
+    """Test that the result doesn't contain proxies reading the caller's object"""
+
+    @smart_args
+    def func(*, d=Isolated(copy_on_write=True)):
+        d["a"]["b"] = 0
+        return {"d": d, "parts": (d["c"], [d["c"]])}
+
+    orig = {"a": {"b": 10}, "c": [1]}
+    res = func(d=orig)
+    orig["c"].append(2)
+    orig["a"]["x"] = 1
+    assert res == {"d": {"a": {"b": 0}, "c": [1]}, "parts": ([1], [[1]])}
+    assert type(res["d"]) is dict and type(res["d"]["c"]) is list
+    assert json.loads(json.dumps(res)) == {
+        "d": {"a": {"b": 0}, "c": [1]},
+        "parts": [[1], [[1]]],
+    }
+
+    @smart_args
+    async def afunc(*, d=Isolated(copy_on_write=True)):
+        return d
+
+    assert type(asyncio.run(afunc(d=orig))) is dict
+
+
+def test_materialize_cycles():
+    """Test materialize of cyclic values"""
+
+    value = [cow({"a": [1]})]
+    value.append(value)
+    res = materialize(value)
+    assert res is value and res[1] is res
+    assert res[0] == {"a": [1]} and type(res[0]) is dict
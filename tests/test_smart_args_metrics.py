@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import pytest
+from project.smart_args import smart_args, Evaluated, Isolated
+from project import smart_args_metrics
+from project.smart_args_metrics import SmartArgsMetrics, deep_size
+
+
+@smart_args
+def slow(*, d=Isolated(), x=Evaluated(lambda: time.sleep(0.01) or 1)):
+    """Function with copied and evaluated arguments"""
+    time.sleep(0.02)
+    return len(d) + x
+
+
+def test_metrics_records_calls():
+    """Test that calls are recorded while metrics are enabled"""
+
+    slow(d=[1])
+    with SmartArgsMetrics(sample_every=2) as metrics:
+        for _ in range(3):
+            assert slow(d=[1, 2]) == 3
+    slow(d=[1])
+    assert smart_args_metrics.active is None
+
+    (stats,) = metrics.functions.values()
+    assert stats.name.endswith("slow")
+    assert stats.calls == 3
+    assert stats.eval_time >= 0.03
+    assert stats.callee_time >= 0.06
+    assert stats.copy_time < stats.callee_time
+    assert stats.size_samples == 2
+    assert stats.max_size >= deep_size([])
+    assert stats.mean_size == stats.max_size
+
+
+def test_metrics_sizes_before_call():
+    """Test that sizes are measured before the function changes copies, without CoW proxies"""
+
+    @smart_args
+    def grow(*, d=Isolated(), view=Isolated(copy_on_write=True)):
+        d.extend(range(1000))
+        view["a"].extend(range(1000))
+
+    data = [1]
+    with SmartArgsMetrics(sample_every=1) as metrics:
+        grow(d=data, view={"a": [1]})
+    (stats,) = metrics.functions.values()
+    assert stats.size_samples == 1
+    assert stats.max_size < deep_size(list(range(1000)))
+    assert data == [1]
+
+
+def test_metrics_summary():
+    """Test table of statistics"""
+
+    metrics = SmartArgsMetrics().enable()
+    try:
+        slow(d={"a": [1]}, x=0)
+    finally:
+        metrics.disable()
+    lines = metrics.summary().splitlines()
+    assert lines[0].split()[:2] == ["function", "calls"]
+    assert len(lines) == 2 and lines[1].split()[1] == "1"
+
+
+def test_metrics_async():
+    """Test metrics of async function"""
+
+    @smart_args
+    async def func(*, x=Evaluated(lambda: 1)):
+        await asyncio.sleep(0.01)
+        return x
+
+    with SmartArgsMetrics() as metrics:
+        assert asyncio.run(func()) == 1
+    (stats,) = metrics.functions.values()
+    assert stats.calls == 1 and stats.callee_time >= 0.01
+
+
+def test_metrics_sampling_overlapping_calls():
+    """Test that overlapping calls are sampled by the number of started calls"""
+
+    @smart_args
+    async def func(*, d=Isolated()):
+        await asyncio.sleep(0.01)
+        return len(d)
+
+    async def main():
+        return await asyncio.gather(*(func(d=[i]) for i in range(50)))
+
+    with SmartArgsMetrics(sample_every=10) as metrics:
+        assert asyncio.run(main()) == [1] * 50
+    (stats,) = metrics.functions.values()
+    assert (stats.calls, stats.started, stats.size_samples) == (50, 50, 5)
+
+
+def test_metrics_errors():
+    """Test invalid sample period and failed calls"""
+
+    with pytest.raises(ValueError):
+        SmartArgsMetrics(sample_every=0)
+
+    @smart_args
+    def fail(*, x=1):
+        raise RuntimeError
+
+    with SmartArgsMetrics() as metrics:
+        with pytest.raises(RuntimeError):
+            fail()
+    assert next(iter(metrics.functions.values())).calls == 1
+
+
+def test_deep_size():
+    """Test approximate size of nested values"""
+
+    shared = [1, 2, 3]
+    assert deep_size([shared, shared]) < deep_size([shared, [1, 2, 3]])
+    assert deep_size({"a": shared}) > deep_size(shared)